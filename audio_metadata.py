@@ -27,6 +27,7 @@ If not, see <http://www.gnu.org/licenses/>.
 """
 
 
+import concurrent.futures
 import logging
 import re
 
@@ -52,6 +53,9 @@ PRX_KEYWORD = re.compile(r"\A[a-z]+\Z", re.I)
 
 SAFE_REPLACEMENT = "_"
 
+# Maximum number of threads reading tags in parallel
+READ_WORKERS = 8
+
 
 #
 # Exceptions
@@ -212,6 +216,7 @@ class Track(SortableHashableMixin):
         self.track_number = None
         self.total_tracks = None
         self.__tags = {}
+        self.__filename_stems = {}
         self.__set_tags(**tags_map)
         self.__tags_changed = tags_changed
         self.reset_sided_position()
@@ -344,13 +349,21 @@ class Track(SortableHashableMixin):
         self, include_artist_name=True, include_medium_number=True
     ):
         """Return a file name suggested from the tags,
-        defused using the PRX_INVALID_FILENAME regular expression
+        defused using the PRX_INVALID_FILENAME regular expression.
+        The file name stem is cached until the tags are changed.
         """
-        fmt = "{0.ARTIST} - {0.TITLE}"
-        if self.ARTIST == self.ALBUMARTIST and not include_artist_name:
-            fmt = "{0.TITLE}"
+        try:
+            stem = self.__filename_stems[include_artist_name]
+        except KeyError:
+            fmt = "{0.ARTIST} - {0.TITLE}"
+            if self.ARTIST == self.ALBUMARTIST and not include_artist_name:
+                fmt = "{0.TITLE}"
+            #
+            stem = PRX_INVALID_FILENAME.sub(
+                SAFE_REPLACEMENT, fmt.format(self)
+            )
+            self.__filename_stems[include_artist_name] = stem
         #
-        stem = PRX_INVALID_FILENAME.sub(SAFE_REPLACEMENT, fmt.format(self))
         prefix = ""
         if self.prefix:
             if include_medium_number:
@@ -403,6 +416,9 @@ class Track(SortableHashableMixin):
             self.__tags[tag_name] = new_value
             tags_changed = True
         #
+        if tags_changed:
+            self.__filename_stems.clear()
+        #
         if tags_map:
             unsupported_tags = ", ".join(
                 "%s=%r" % (key, value)
@@ -1057,26 +1073,40 @@ class Release(SortableHashableMixin):
 #
 
 
+def read_track(file_path):
+    """Return a Track object read from file_path,
+    or None if the file is not supported by taglib
+    """
+    try:
+        return Track.from_path(file_path)
+    except NoSupportedFile:
+        logging.debug("File %r not supported by taglib", str(file_path))
+    #
+    return None
+
+
 def get_release_from_path(base_directory_path):
     """Get a Release object containing all the tracks in the
-    base directory path
+    base directory path.
+    Tags are read from the files using a thread pool.
     """
     absolute_base_directory = base_directory_path.absolute()
     found_release = None
     if not absolute_base_directory.is_dir():
         raise ValueError("%s is not a directory" % absolute_base_directory)
     #
-    for file_path in absolute_base_directory.glob("*"):
-        full_file_path = absolute_base_directory / file_path
-        if full_file_path.is_dir():
-            continue
-        #
-        try:
-            current_audio_track = Track.from_path(full_file_path)
-        except NoSupportedFile:
-            logging.debug(
-                "File %r not supported by taglib", str(full_file_path)
-            )
+    file_paths = sorted(
+        file_path
+        for file_path in absolute_base_directory.glob("*")
+        if not file_path.is_dir()
+    )
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=READ_WORKERS
+    ) as executor:
+        found_tracks = list(executor.map(read_track, file_paths))
+    #
+    for current_audio_track in found_tracks:
+        if current_audio_track is None:
             continue
         #
         logging.debug("Got track %r", current_audio_track)
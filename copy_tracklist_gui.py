@@ -11,6 +11,7 @@ Copy a tracklist to the clipboard
 """
 
 
+import functools
 import os
 import pathlib
 import sys
@@ -167,76 +168,96 @@ class UserInterface(gui_commons.UserInterface):
         else:
             preset_path = self.directory_path
         #
-        while True:
-            if not keep_existing or self.directory_path is None:
-                selected_directory = filedialog.askdirectory(
-                    initialdir=str(preset_path) or os.getcwd()
-                )
-                if not selected_directory:
-                    if quit_on_empty_choice:
-                        self.quit()
-                    #
-                    return
+        if not keep_existing or self.directory_path is None:
+            selected_directory = filedialog.askdirectory(
+                initialdir=str(preset_path) or os.getcwd()
+            )
+            if not selected_directory:
+                if quit_on_empty_choice:
+                    self.quit()
                 #
-                self.directory_path = pathlib.Path(selected_directory)
+                return
             #
+            self.directory_path = pathlib.Path(selected_directory)
+        #
+        self.read_release(quit_on_empty_choice=quit_on_empty_choice)
+
+    def read_release(self, quit_on_empty_choice=False):
+        """Read self.directory_path in the background
+        and show the release data when done
+        """
+
+        def release_loaded(future):
+            """Set self.release from the future result,
+            or schedule choosing another release if reading failed
+            """
             try:
-                self.read_release()
+                self.release = future.result()
             except ValueError as error:
                 messagebox.showerror(
                     "Error while reading release",
                     str(error),
                     icon=messagebox.ERROR,
                 )
-                keep_existing = False
-                continue
-            #
-            self.release_data.update_from_release(self.release)
-            if self.media_area:
-                self.media_area.grid_forget()
+                # Let the UI redraw before showing the directory dialog
+                self.main_window.after_idle(
+                    functools.partial(
+                        self.choose_release,
+                        preset_path=self.directory_path,
+                        quit_on_empty_choice=quit_on_empty_choice,
+                    )
+                )
+                return
             #
-            self.media_area = tkinter.Frame(self.action_frame)
-            self.media_area.columnconfigure(1, weight=1)
-            for (row_number, medium_number) in enumerate(
-                self.release.medium_numbers
-            ):
-
-                def copy_tracklist_handler(self=self, number=medium_number):
-                    """Internal function definition to process the medium
-                    number in the "real" handler function,
-                    compare <https://tkdocs.com/shipman/extra-args.html>.
-                    """
-                    return self.copy_tracklist(medium_number=number)
+            self.show_release()
 
-                #
-                medium = self.release[medium_number]
-                medium_length = "%02d:%02d" % divmod(medium.total_length, 60)
-                button = tkinter.Button(
-                    self.media_area,
-                    text="Copy",
-                    command=copy_tracklist_handler,
-                )
-                button.grid(row=row_number, column=0, padx=4, sticky=tkinter.W)
-                media_label = tkinter.Label(
-                    self.media_area,
-                    text="tracklist of medium #%s (%s tracks,"
-                    " total length: %s)"
-                    % (medium_number, medium.counted_tracks, medium_length),
-                    justify=tkinter.LEFT,
-                )
-                media_label.grid(
-                    row=row_number, column=1, padx=4, sticky=tkinter.W
-                )
-            self.media_area.grid(
-                row=2, column=0, columnspan=3, sticky=tkinter.E + tkinter.W
-            )
-            break
         #
+        self.run_in_background(
+            release_loaded,
+            audio_metadata.get_release_from_path,
+            self.directory_path,
+        )
+
+    def show_release(self):
+        """Show the data of self.release"""
+        self.release_data.update_from_release(self.release)
+        if self.media_area:
+            self.media_area.grid_forget()
+        #
+        self.media_area = tkinter.Frame(self.action_frame)
+        self.media_area.columnconfigure(1, weight=1)
+        for (row_number, medium_number) in enumerate(
+            self.release.medium_numbers
+        ):
+
+            def copy_tracklist_handler(self=self, number=medium_number):
+                """Internal function definition to process the medium
+                number in the "real" handler function,
+                compare <https://tkdocs.com/shipman/extra-args.html>.
+                """
+                return self.copy_tracklist(medium_number=number)
 
-    def read_release(self):
-        """Set self.release by reading self.directory_path"""
-        self.release = audio_metadata.get_release_from_path(
-            self.directory_path
+            #
+            medium = self.release[medium_number]
+            medium_length = "%02d:%02d" % divmod(medium.total_length, 60)
+            button = tkinter.Button(
+                self.media_area,
+                text="Copy",
+                command=copy_tracklist_handler,
+            )
+            button.grid(row=row_number, column=0, padx=4, sticky=tkinter.W)
+            media_label = tkinter.Label(
+                self.media_area,
+                text="tracklist of medium #%s (%s tracks,"
+                " total length: %s)"
+                % (medium_number, medium.counted_tracks, medium_length),
+                justify=tkinter.LEFT,
+            )
+            media_label.grid(
+                row=row_number, column=1, padx=4, sticky=tkinter.W
+            )
+        self.media_area.grid(
+            row=2, column=0, columnspan=3, sticky=tkinter.E + tkinter.W
         )
 
     def copy_tracklist(self, medium_number=None):
@@ -297,23 +318,7 @@ class UserInterface(gui_commons.UserInterface):
 
 def main():
     """Main script function"""
-    selected_directory = None
-    try:
-        selected_names = os.environ["NAUTILUS_SCRIPT_SELECTED_FILE_PATHS"]
-    except KeyError:
-        pass
-    else:
-        for name in selected_names.splitlines():
-            if name:
-                current_path = pathlib.Path(name)
-                if current_path.is_dir():
-                    selected_directory = current_path
-                    break
-                #
-            #
-        #
-    #
-    UserInterface(selected_directory)
+    UserInterface(gui_commons.get_selected_directory())
 
 
 if __name__ == "__main__":
@@ -27,12 +27,15 @@ If not, see <http://www.gnu.org/licenses/>.
 """
 
 
+import concurrent.futures
+import os
 import pathlib
 import sys
 import tkinter
 
 # from tkinter import filedialog
 from tkinter import messagebox
+from tkinter import ttk
 
 
 #
@@ -60,6 +63,9 @@ If not, see <http://www.gnu.org/licenses/>."""
 
 HOMEPAGE = "https://github.com/blackstream-x/musicbrain"
 
+# Interval (in milliseconds) for checking if a background task is done
+POLL_INTERVAL = 50
+
 
 #
 # Classes
@@ -157,31 +163,67 @@ class InfoDialog(ModalDialog):
 
 class ConfirmRenameDialog(ModalDialog):
 
-    """Info dialog,
-    instantiated with a seriess of (heading, paragraph) tuples
+    """Confirmation dialog,
+    instantiated with a renaming plan
     after the parent window
     """
 
     def __init__(self, parent, renaming_plan):
         """..."""
         self.renaming_plan = renaming_plan
-        content = [
-            (
-                "The following files will be renamed:",
-                "\n".join(
-                    f"{item.source_path.name!r}\n → {item.target_path.name!r}"
-                    for item in renaming_plan
+        self.result = None
+        super().__init__(
+            parent,
+            "The following files will be renamed:",
+            title="Confirm rename",
+            cancel_button=True,
+        )
+
+    def create_content(self, content):
+        """Add the heading and a scrollable tree view
+        (which only draws the visible rows) to body
+        """
+        heading_area = tkinter.Label(
+            self.body,
+            text=content,
+            font=(None, 11, "bold"),
+            justify=tkinter.LEFT,
+        )
+        heading_area.grid(
+            row=0, column=0, columnspan=2, sticky=tkinter.W, padx=5, pady=10
+        )
+        renamings_view = ttk.Treeview(
+            master=self.body,
+            columns=("source", "target"),
+            height=15,
+            selectmode=tkinter.BROWSE,
+            show="headings",
+        )
+        renamings_view.heading("source", text="Current file name")
+        renamings_view.heading("target", text="New file name")
+        renamings_view.column("source", width=350)
+        renamings_view.column("target", width=350)
+        for rename_item in self.renaming_plan:
+            renamings_view.insert(
+                "",
+                tkinter.END,
+                values=(
+                    rename_item.source_path.name,
+                    rename_item.target_path.name,
                 ),
             )
-        ]
-        super().__init__(
-            parent, content, title="Confirm rename", cancel_button=True
+        #
+        scroll_vertical = tkinter.Scrollbar(
+            self.body, orient=tkinter.VERTICAL, command=renamings_view.yview
         )
+        renamings_view["yscrollcommand"] = scroll_vertical.set
+        renamings_view.grid(row=1, column=0, padx=5, pady=5)
+        scroll_vertical.grid(row=1, column=1, sticky=tkinter.N + tkinter.S)
 
     def action_ok(self, event=None):
         """Execute the renamings according to the plan"""
         del event
-        result = self.renaming_plan.execute()
+        result = self.result = self.renaming_plan.execute()
         conflict_messages = result.get_conflict_messages()
         error_messages = result.get_error_messages()
         number_of_renamings = len(result.renamed_files)
@@ -215,19 +257,56 @@ class UserInterface:
     window_title = "musicbrain: script specific title"
 
     def __init__(self):
-        """Read the version file and create the main window"""
-        script_path = pathlib.Path(sys.argv[0])
-        if script_path.is_symlink():
-            script_path = script_path.readlink()
-        #
-        version_path = script_path.parent / "version.txt"
-        try:
-            self.version = version_path.read_text().strip()
-        except OSError as os_error:
-            self.version = f"(Version file is missing: {os_error})"
-        #
+        """Create the main window"""
+        self.__version = None
         self.main_window = tkinter.Tk()
         self.main_window.title(self.window_title)
+        self.background_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1
+        )
+
+    @property
+    def version(self):
+        """The version, read from the version file on first access"""
+        if self.__version is None:
+            script_path = pathlib.Path(sys.argv[0])
+            if script_path.is_symlink():
+                script_path = script_path.readlink()
+            #
+            version_path = script_path.parent / "version.txt"
+            try:
+                self.__version = version_path.read_text().strip()
+            except OSError as os_error:
+                self.__version = f"(Version file is missing: {os_error})"
+            #
+        #
+        return self.__version
+
+    def run_in_background(self, callback, function, *args, **kwargs):
+        """Run function in a worker thread while showing
+        an indeterminate progress bar.
+        As soon as it is done, callback is called with the
+        concurrent.futures.Future object from the tkinter main thread.
+        """
+        progress_bar = ttk.Progressbar(self.main_window, mode="indeterminate")
+        progress_bar.grid(padx=4, pady=2, sticky=tkinter.E + tkinter.W)
+        progress_bar.start()
+        future = self.background_executor.submit(function, *args, **kwargs)
+
+        def check_future():
+            """Poll the future from the tkinter event loop
+            (tkinter must not be called from the worker thread)
+            """
+            if not future.done():
+                self.main_window.after(POLL_INTERVAL, check_future)
+                return
+            #
+            progress_bar.stop()
+            progress_bar.destroy()
+            callback(future)
+
+        #
+        self.main_window.after(POLL_INTERVAL, check_future)
 
     def show_about(self):
         """Show information about the application
@@ -250,4 +329,30 @@ class UserInterface:
         self.main_window.destroy()
 
 
+#
+# Functions
+#
+
+
+def get_selected_directory(default=None):
+    """Return the first directory selected in the file manager
+    (as passed via the NAUTILUS_SCRIPT_SELECTED_FILE_PATHS
+    environment variable) as a pathlib.Path, or default
+    if no directory was selected
+    """
+    try:
+        selected_names = os.environ["NAUTILUS_SCRIPT_SELECTED_FILE_PATHS"]
+    except KeyError:
+        return default
+    #
+    # Nautilus separates the paths by newlines only,
+    # other line boundary characters may be part of a file name
+    for name in selected_names.split("\n"):
+        if name and os.path.isdir(name):
+            return pathlib.Path(name)
+        #
+    #
+    return default
+
+
 # vim: fileencoding=utf-8 ts=4 sts=4 sw=4 autoindent expandtab syntax=python:
@@ -27,8 +27,17 @@ If not, see <http://www.gnu.org/licenses/>.
 """
 
 
+import collections
+import dbm
+import functools
+import hashlib
+import json
 import logging
+import os
+import pathlib
 import re
+import shelve
+import time
 
 # non-standardlib module
 
@@ -62,14 +71,34 @@ PRX_MBID = re.compile(
 
 FS_RELEASE_URL = "https://musicbrainz.org/release/%s"
 
+RELEASE_INCLUDES = ["media", "artists", "recordings", "artist-credits"]
+RELEASE_BROWSE_INCLUDES = ["media", "recordings", "artist-credits"]
+RELEASE_BROWSE_LIMIT = 100
+
+# Persistent cache for MusicBrainz lookups
+CACHE_PATH = (
+    pathlib.Path(os.environ.get("XDG_CACHE_HOME") or "~/.cache").expanduser()
+    / "musicbrain"
+    / "musicbrainz_lookups"
+)
+# Keep entries only briefly, so corrections made on MusicBrainz
+# show up soon (see also the --no-cache and --clear-cache options
+# of update_from_musicbrainz_gui.py)
+CACHE_MAX_AGE = 3600
+# Maximum number of lookup results additionally kept in memory
+MEMORY_CACHE_SIZE = 256
+
 
 #
 # Helper Functions
 #
 
 
+@functools.lru_cache(maxsize=128)
 def extract_id(source_text):
-    """Return a musicbrainz ID from a string"""
+    """Return a musicbrainz ID from a string
+    (results are memoized, errors are not)
+    """
     try:
         return PRX_MBID.match(source_text).group(1)
     except AttributeError as error:
@@ -82,6 +111,18 @@ def extract_id(source_text):
 def set_useragent(script_name, version, contact):
     """Wrapper function setting the user agent"""
     musicbrainzngs.set_useragent(script_name, version, contact=contact)
+    # The musicbrainzngs rate limiter (a token bucket) is kept as is:
+    # it does not delay the first request, and only waits as long
+    # as necessary between subsequent ones.
+    # Lookups answered from REQUESTS_CACHE bypass it completely.
+
+
+def set_cache(path=CACHE_PATH, max_age=CACHE_MAX_AGE):
+    """Enable the persistent cache for MusicBrainz lookups
+    (or disable it if path is None)
+    """
+    REQUESTS_CACHE.path = path
+    REQUESTS_CACHE.max_age = max_age
 
 
 #
@@ -99,6 +140,102 @@ class TrackNotFound(Exception):
     """Raised if the specified track is not found"""
 
 
+class RequestsCache:
+
+    """Persistent cache for MusicBrainz lookups
+    using a shelve database,
+    with the most recently used entries also kept in memory
+    """
+
+    def __init__(self, path=None, max_age=CACHE_MAX_AGE):
+        """Store the database path (None disables the cache)
+        and the maximum age of entries in seconds
+        """
+        self.path = path
+        self.max_age = max_age
+        self.__memory = collections.OrderedDict()
+
+    def __remember(self, key, entry):
+        """Keep the (timestamp, data) entry in memory,
+        evicting the least recently used one if necessary
+        """
+        self.__memory[key] = entry
+        self.__memory.move_to_end(key)
+        if len(self.__memory) > MEMORY_CACHE_SIZE:
+            self.__memory.popitem(last=False)
+        #
+
+    def clear(self):
+        """Remove all entries from memory and from the database"""
+        self.__memory.clear()
+        if self.path is None:
+            return
+        #
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with shelve.open(str(self.path), flag="n"):
+                pass
+            #
+        except dbm.error as error:
+            logging.warning("Cannot clear the cache: %s", error)
+        #
+
+    @staticmethod
+    def make_key(function, *args, **kwargs):
+        """Return a cache key for the function call"""
+        serialized_call = json.dumps(
+            [function.__name__, args, kwargs], sort_keys=True
+        )
+        return hashlib.sha1(serialized_call.encode("utf-8")).hexdigest()
+
+    def call(self, function, *args, **kwargs):
+        """Return the cached result of the function call
+        if it is not expired yet, else call the function
+        and cache its result
+        """
+        if self.path is None:
+            return function(*args, **kwargs)
+        #
+        key = self.make_key(function, *args, **kwargs)
+        now = time.time()
+        try:
+            (timestamp, data) = self.__memory[key]
+        except KeyError:
+            pass
+        else:
+            if now - timestamp < self.max_age:
+                self.__memory.move_to_end(key)
+                return data
+            #
+        #
+        try:
+            with shelve.open(str(self.path), flag="r") as cache:
+                (timestamp, data) = cache[key]
+            #
+        except KeyError:
+            pass
+        except dbm.error as error:
+            logging.debug("Cannot read from cache: %s", error)
+        else:
+            if now - timestamp < self.max_age:
+                logging.debug("Using cached result of %s", function.__name__)
+                self.__remember(key, (timestamp, data))
+                return data
+            #
+        #
+        data = function(*args, **kwargs)
+        self.__remember(key, (now, data))
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with shelve.open(str(self.path)) as cache:
+                cache[key] = (now, data)
+            #
+        except dbm.error as error:
+            logging.warning("Cannot write to cache: %s", error)
+        #
+        return data
+
+
 class Translator:
 
     """Translator class for one replacement"""
@@ -128,22 +265,143 @@ class RegexTranslator(Translator):
         return self.__prx.sub(self.replacement, text)
 
 
+class FusedTranslator:
+
+    """Translator for a group of independent literal replacements,
+    applied in a single pass: single characters are replaced
+    using a translation table, longer originals using
+    one precompiled alternation
+    """
+
+    def __init__(self, *translators):
+        """Build the translation table, the alternation
+        and the replacements lookup
+        """
+        self.__table = {}
+        self.__replacements = {}
+        alternatives = []
+        for (index, single_translator) in enumerate(translators):
+            if len(single_translator.original) == 1:
+                self.__table[
+                    single_translator.original
+                ] = single_translator.replacement
+                continue
+            #
+            group_name = "t%s" % index
+            self.__replacements[group_name] = single_translator.replacement
+            alternatives.append(
+                "(?P<%s>%s)"
+                % (group_name, re.escape(single_translator.original))
+            )
+        #
+        self.__table = str.maketrans(self.__table)
+        self.__prx = None
+        if alternatives:
+            self.__prx = re.compile("|".join(alternatives))
+        #
+
+    @staticmethod
+    def can_fuse(*translators):
+        """Return True if the given literal translators can be applied
+        in a single pass with the same result as sequentially:
+        their originals must not share any characters,
+        no replacement may contain any character of an original,
+        and no replacement may be empty (deleting text could make
+        the neighbouring characters match a later original).
+        """
+        original_characters = set()
+        for single_translator in translators:
+            current_characters = set(single_translator.original)
+            if (
+                not current_characters
+                or not single_translator.replacement
+                or current_characters & original_characters
+            ):
+                return False
+            #
+            original_characters.update(current_characters)
+        #
+        for single_translator in translators:
+            if original_characters.intersection(single_translator.replacement):
+                return False
+            #
+        #
+        return True
+
+    def __dispatch(self, match):
+        """Return the replacement for the matched group"""
+        return self.__replacements[match.lastgroup]
+
+    def translate(self, text):
+        """Translate text, returns the modified text."""
+        if self.__table:
+            text = text.translate(self.__table)
+        #
+        if self.__prx:
+            text = self.__prx.sub(self.__dispatch, text)
+        #
+        return text
+
+
 class TranslatorChain:
 
-    """Chain of translator objects applied sequentially"""
+    """Chain of translator objects applied sequentially.
+    Runs of consecutive literal translators that do not affect
+    each other are fused into a single pass.
+    """
 
     def __init__(self, *translators):
         """Keep a sequence of translators"""
         self.__translators = list(translators)
+        self.__stages = None
 
     def append(self, single_translator):
         """Append a translator"""
         self.__translators.append(single_translator)
+        self.__stages = None
+
+    def __build_stages(self):
+        """Return a list of translators to be applied sequentially,
+        fusing runs of literal translators where possible
+        """
+        stages = []
+        literal_run = []
+        for single_translator in self.__translators:
+            if isinstance(single_translator, Translator) and not isinstance(
+                single_translator, RegexTranslator
+            ):
+                if FusedTranslator.can_fuse(*literal_run, single_translator):
+                    literal_run.append(single_translator)
+                    continue
+                #
+                stages.extend(self.__fuse(literal_run))
+                literal_run = [single_translator]
+                continue
+            #
+            stages.extend(self.__fuse(literal_run))
+            literal_run = []
+            stages.append(single_translator)
+        #
+        stages.extend(self.__fuse(literal_run))
+        return stages
+
+    @staticmethod
+    def __fuse(literal_run):
+        """Return a list containing the fused translator
+        for the literal run
+        """
+        if len(literal_run) > 1:
+            return [FusedTranslator(*literal_run)]
+        #
+        return literal_run
 
     def translate(self, text):
         """Apply the translations sequentially"""
+        if self.__stages is None:
+            self.__stages = self.__build_stages()
+        #
         result = text
-        for single_translator in self.__translators:
+        for single_translator in self.__stages:
             result = single_translator.translate(result)
         #
         return result
@@ -315,6 +573,16 @@ class Release(Translatable):
             self.score = score_calculation.get_score_for(self)
         #
 
+    @property
+    def has_tracklists(self):
+        """True if all media contain their tracklists
+        (which is not the case in search results)
+        """
+        return all(
+            medium.track_count == len(medium.tracks_list)
+            for medium in self.media_list
+        )
+
     @property
     def summary(self):
         """Summary of contained media with track counts"""
@@ -673,19 +941,45 @@ class LocalTrackChanges:
         #
         self.__use_value[key] = 1 - self.__use_value[key]
 
-    def display(self, key):
-        """Display what would happen"""
-        value = self.effective_value(key)
-        if self.__use_value[key]:
+    @staticmethod
+    def __format_display(key, value, use_value):
+        """Return the display text for the key and its effective value"""
+        if use_value:
             return "%s \u21d2 %r" % (key, value)
         #
         return "%s \u2205 %r" % (key, value)
 
+    def display(self, key):
+        """Display what would happen"""
+        return self.__format_display(
+            key, self.effective_value(key), self.__use_value[key]
+        )
+
+    def iter_display(self):
+        """Yield (key, display text) tuples for all changes
+        in a single pass
+        """
+        for (key, values) in self.__changes.items():
+            use_value = self.__use_value[key]
+            yield (
+                key,
+                self.__format_display(key, values[use_value], use_value),
+            )
+        #
+
     def __len__(self):
         """Number of identified changes"""
         return len(self.__changes)
 
 
+#
+# Module-level cache instance (disabled until set_cache() is called)
+#
+
+
+REQUESTS_CACHE = RequestsCache()
+
+
 #
 # Functions
 #
@@ -701,9 +995,10 @@ def local_release_from_path(directory_path):
 def release_from_id(release_mbid, local_release=None):
     """Return a Release object from a MusicBrainz Query"""
     try:
-        release_data = musicbrainzngs.get_release_by_id(
+        release_data = REQUESTS_CACHE.call(
+            musicbrainzngs.get_release_by_id,
             release_mbid,
-            includes=["media", "artists", "recordings", "artist-credits"],
+            includes=RELEASE_INCLUDES,
         )
     except musicbrainzngs.musicbrainz.ResponseError as error:
         raise ValueError(
@@ -719,6 +1014,72 @@ def release_from_id(release_mbid, local_release=None):
     )
 
 
+def releases_from_release_group(release_group_mbid, local_release=None):
+    """Return a list of Release objects (including their tracklists)
+    from the release group, fetched using a single browse request
+    """
+    try:
+        browse_result = REQUESTS_CACHE.call(
+            musicbrainzngs.browse_releases,
+            release_group=release_group_mbid,
+            includes=RELEASE_BROWSE_INCLUDES,
+            limit=RELEASE_BROWSE_LIMIT,
+        )
+    except musicbrainzngs.musicbrainz.ResponseError as error:
+        raise ValueError(
+            "No release group in MusicBrainz with ID %r." % release_group_mbid
+        ) from error
+    #
+    score_calculation = None
+    if local_release:
+        score_calculation = ScoreCalculation(local_release)
+    #
+    found_releases = []
+    for single_release in browse_result["release-list"]:
+        try:
+            found_releases.append(
+                Release(single_release, score_calculation=score_calculation)
+            )
+        except KeyError as key_error:
+            logging.warning("Missing key in metadata: %s", key_error)
+        #
+    #
+    if not found_releases:
+        raise ValueError(
+            "No releases found in release group %r." % release_group_mbid
+        )
+    #
+    return found_releases
+
+
+def releases_from_id(source_text, local_release=None):
+    """Return a list of Release objects for the MusicBrainz ID
+    contained in source_text: all releases of the release group
+    if source_text is a release group URL, else the release
+    with that ID, or all releases of the release group with that ID
+    if there is no such release.
+    """
+    mbid = extract_id(source_text)
+    if "release-group" not in source_text:
+        try:
+            return [release_from_id(mbid, local_release=local_release)]
+        except ValueError as error:
+            logging.debug("%s Trying a release group lookup.", error)
+        #
+        try:
+            return releases_from_release_group(
+                mbid, local_release=local_release
+            )
+        except ValueError as error:
+            raise ValueError(
+                "No release or release group in MusicBrainz"
+                " with ID %r." % mbid
+            ) from error
+        #
+    #
+    return releases_from_release_group(mbid, local_release=local_release)
+
+
 def releases_from_search(album=None, albumartist=None, local_release=None):
     """Execute a search in MusicBrainz and return a list
     of Release objects
@@ -737,8 +1098,8 @@ def releases_from_search(album=None, albumartist=None, local_release=None):
     if local_release:
         score_calculation = ScoreCalculation(local_release)
     #
-    query_result = musicbrainzngs.search_releases(
-        query=" AND ".join(search_criteria)
+    query_result = REQUESTS_CACHE.call(
+        musicbrainzngs.search_releases, query=" AND ".join(search_criteria)
     )
     #
     found_releases = []
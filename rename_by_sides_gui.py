@@ -11,6 +11,7 @@ Rename tracks according to media sides
 """
 
 
+import functools
 import os
 import pathlib
 import sys
@@ -71,9 +72,7 @@ class ReleaseData:
         """Set variables from the release"""
         self.album.set(release.album)
         self.albumartist.set(release.albumartist)
-        self.medium_numbers = tuple(
-            str(number) for number in release.medium_numbers
-        )
+        self.medium_numbers = tuple(map(str, release.medium_numbers))
 
 
 class UserInterface(gui_commons.UserInterface):
@@ -285,55 +284,75 @@ class UserInterface(gui_commons.UserInterface):
         else:
             preset_path = self.directory_path
         #
-        while True:
-            if not keep_existing or self.directory_path is None:
-                selected_directory = filedialog.askdirectory(
-                    initialdir=str(preset_path) or os.getcwd()
-                )
-                if not selected_directory:
-                    if quit_on_empty_choice:
-                        self.quit()
-                    #
-                    return
+        if not keep_existing or self.directory_path is None:
+            selected_directory = filedialog.askdirectory(
+                initialdir=str(preset_path) or os.getcwd()
+            )
+            if not selected_directory:
+                if quit_on_empty_choice:
+                    self.quit()
                 #
-                self.directory_path = pathlib.Path(selected_directory)
+                return
             #
+            self.directory_path = pathlib.Path(selected_directory)
+        #
+        self.read_release(quit_on_empty_choice=quit_on_empty_choice)
+
+    def read_release(self, quit_on_empty_choice=False):
+        """Read self.directory_path in the background
+        and show the release data when done
+        """
+
+        def release_loaded(future):
+            """Set self.release from the future result,
+            or schedule choosing another release if reading failed
+            """
             try:
-                self.read_release()
+                self.release = future.result()
             except ValueError as error:
                 messagebox.showerror(
                     "Error while reading release",
                     str(error),
                     icon=messagebox.ERROR,
                 )
-                keep_existing = False
-                continue
-            #
-            self.release_data.update_from_release(self.release)
-            if self.medium_number:
-                self.medium_number.grid_forget()
+                # Let the UI redraw before showing the directory dialog
+                self.main_window.after_idle(
+                    functools.partial(
+                        self.choose_release,
+                        preset_path=self.directory_path,
+                        quit_on_empty_choice=quit_on_empty_choice,
+                    )
+                )
+                return
             #
-            self.medium_number = tkinter.Spinbox(
-                self.action_frame,
-                command=self.read_medium,
-                state="readonly",
-                width=2,
-                values=self.release_data.medium_numbers,
-            )
-            self.medium_number.grid(
-                row=2, column=1, columnspan=3, padx=4, sticky=tkinter.W
-            )
-            self.current_medium_number = None
-            self.include_medium.set(self.release.medium_prefixes_required)
-            self.read_medium()
-            break
+            self.show_release()
+
         #
+        self.run_in_background(
+            release_loaded,
+            audio_metadata.get_release_from_path,
+            self.directory_path,
+        )
 
-    def read_release(self):
-        """Set self.release by reading self.directory_path"""
-        self.release = audio_metadata.get_release_from_path(
-            self.directory_path
+    def show_release(self):
+        """Show the data of self.release"""
+        self.release_data.update_from_release(self.release)
+        if self.medium_number:
+            self.medium_number.grid_forget()
+        #
+        self.medium_number = tkinter.Spinbox(
+            self.action_frame,
+            command=self.read_medium,
+            state="readonly",
+            width=2,
+            values=self.release_data.medium_numbers,
+        )
+        self.medium_number.grid(
+            row=2, column=1, columnspan=3, padx=4, sticky=tkinter.W
         )
+        self.current_medium_number = None
+        self.include_medium.set(self.release.medium_prefixes_required)
+        self.read_medium()
 
     def read_medium(self):
         """Read the value from the self.medium_number spinbox,
@@ -393,6 +412,10 @@ class UserInterface(gui_commons.UserInterface):
         (side names, tracks distribution, toal length),
         and update the displayed fields
         """
+        if self.sided_medium is None:
+            # Release data are still being read
+            return
+        #
         if not first_side_tracks:
             first_side_tracks = self.first_side_tracks.get()
         #
@@ -420,6 +443,9 @@ class UserInterface(gui_commons.UserInterface):
 
     def guess_sides(self):
         """Guess sides by length"""
+        if self.sided_medium is None:
+            return
+        #
         both_sides = self.sided_medium.guess_sides()
         self.first_side_tracks.set(both_sides[0].number_of_tracks)
         try:
@@ -432,6 +458,9 @@ class UserInterface(gui_commons.UserInterface):
 
     def apply_changes(self):
         """Apply changes  after showing a confirmation dialog"""
+        if self.sided_medium is None:
+            return
+        #
         self.set_sides()
         if not all(
             self.side_data[side_index].name.get() for side_index in (0, 1)
@@ -454,9 +483,12 @@ class UserInterface(gui_commons.UserInterface):
             )
         #
         if renaming_plan:
-            gui_commons.ConfirmRenameDialog(self.main_window, renaming_plan)
-            # Refresh release and medium information
-            self.choose_release(keep_existing=True)
+            dialog = gui_commons.ConfirmRenameDialog(
+                self.main_window, renaming_plan
+            )
+            if dialog.result is not None:
+                self.apply_rename_results(dialog.result)
+            #
         else:
             messagebox.showinfo(
                 "No renaming necessary",
@@ -465,6 +497,29 @@ class UserInterface(gui_commons.UserInterface):
             )
         #
 
+    def apply_rename_results(self, result):
+        """Update the file paths of the renamed tracks in place
+        (instead of re-reading the whole release from disk)
+        and refresh release and medium information
+        """
+        new_names = {
+            item.source_path.name: item.target_path.name
+            for item in result.renamed_files
+        }
+        if not new_names:
+            return
+        #
+        for track in self.release.get_all_tracks():
+            try:
+                new_name = new_names[track.file_path.name]
+            except KeyError:
+                continue
+            #
+            track.file_path = track.file_path.with_name(new_name)
+            track.reset_sided_position()
+        #
+        self.show_release()
+
 
 #
 # Functions
@@ -473,23 +528,7 @@ class UserInterface(gui_commons.UserInterface):
 
 def main():
     """Main script function"""
-    selected_directory = None
-    try:
-        selected_names = os.environ["NAUTILUS_SCRIPT_SELECTED_FILE_PATHS"]
-    except KeyError:
-        pass
-    else:
-        for name in selected_names.splitlines():
-            if name:
-                current_path = pathlib.Path(name)
-                if current_path.is_dir():
-                    selected_directory = current_path
-                    break
-                #
-            #
-        #
-    #
-    UserInterface(selected_directory)
+    UserInterface(gui_commons.get_selected_directory())
 
 
 if __name__ == "__main__":
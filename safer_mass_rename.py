@@ -47,6 +47,18 @@ INDIRECTION_FAILED = "indirection failed"
 DONE = "done"
 NO_RENAME_REQUIRED = "no rename required"
 
+# Rename relative to open directory file descriptors
+# in plans with more items than this threshold
+DIR_FD_THRESHOLD = 16
+DIR_FD_SUPPORTED = (
+    hasattr(os, "O_DIRECTORY")
+    and os.rename in os.supports_dir_fd
+    and os.stat in os.supports_dir_fd
+)
+
+# Shared empty set of paths allowed to be overwritten
+EMPTY_PATHS = frozenset()
+
 
 #
 # Exceptions
@@ -77,11 +89,82 @@ class DestinationPathExists(Exception):
     """
 
 
+#
+# Helper functions
+#
+
+
+def path_exists(path, dir_fd=None):
+    """Return True if the path exists.
+    If dir_fd is given, check the file name relative to it.
+    """
+    if dir_fd is None:
+        return os.path.exists(path)
+    #
+    try:
+        os.stat(path.name, dir_fd=dir_fd)
+    except FileNotFoundError:
+        return False
+    #
+    return True
+
+
 #
 # Classes
 #
 
 
+class DirectoryDescriptors:
+
+    """Open directory file descriptors, cached by directory path.
+    Use instances as context managers to close the descriptors.
+    """
+
+    def __init__(self, enabled=True):
+        """Set attributes"""
+        self.enabled = enabled and DIR_FD_SUPPORTED
+        self.__descriptors = {}
+
+    def get(self, directory_path):
+        """Return an open file descriptor for directory_path,
+        or None if descriptors are disabled or the directory
+        cannot be opened
+        """
+        if not self.enabled:
+            return None
+        #
+        try:
+            return self.__descriptors[directory_path]
+        except KeyError:
+            pass
+        #
+        try:
+            dir_fd = os.open(str(directory_path), os.O_RDONLY | os.O_DIRECTORY)
+        except OSError as error:
+            logging.debug(
+                "Cannot open directory %r: %s", str(directory_path), error
+            )
+            return None
+        #
+        self.__descriptors[directory_path] = dir_fd
+        return dir_fd
+
+    def close(self):
+        """Close all descriptors"""
+        for dir_fd in self.__descriptors.values():
+            os.close(dir_fd)
+        #
+        self.__descriptors.clear()
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Context manager exit: close all descriptors"""
+        self.close()
+
+
 class RenameItem:
 
     """A single renaming of a source path to a new file name
@@ -104,7 +187,8 @@ class RenameItem:
                 % str(self.__source_path)
             )
         #
-        self.__target_path = self.__source_path.parent / target_file_name
+        self.__directory_path = self.__source_path.parent
+        self.__target_path = self.__directory_path / target_file_name
         self.__intermediate_path = None
         if self.__source_path == self.__target_path:
             self.__state = NO_RENAME_REQUIRED
@@ -117,6 +201,11 @@ class RenameItem:
         """state property"""
         return self.__state
 
+    @property
+    def directory_path(self):
+        """directory_path property"""
+        return self.__directory_path
+
     @property
     def source_path(self):
         """source_path property"""
@@ -128,10 +217,15 @@ class RenameItem:
         return self.__target_path
 
     @staticmethod
-    def __rename_path(source, target, overwrite_allowed=None):
-        """Rename the source path to the target path"""
-        if target.exists():
-            if target not in (overwrite_allowed or set()):
+    def __rename_path(source, target, overwrite_allowed=None, dir_fd=None):
+        """Rename the source path to the target path.
+        If dir_fd is given, rename the file names relative to it.
+        """
+        if path_exists(target, dir_fd=dir_fd):
+            if overwrite_allowed is None:
+                overwrite_allowed = EMPTY_PATHS
+            #
+            if target not in overwrite_allowed:
                 raise DestinationPathExists
             #
             logging.debug(
@@ -139,10 +233,18 @@ class RenameItem:
                 target.name,
             )
         #
-        logging.debug("Renaming %r to %r", source.name, target.name)
-        source.rename(target)
+        if dir_fd is None:
+            os.rename(source, target)
+        else:
+            os.rename(
+                source.name,
+                target.name,
+                src_dir_fd=dir_fd,
+                dst_dir_fd=dir_fd,
+            )
+        #
 
-    def do_rename(self, overwrite_allowed=None):
+    def do_rename(self, overwrite_allowed=None, dir_fd=None):
         """Rename source path to target_path"""
         if self.state != READY:
             raise ValueError("Illegal state %r" % self.state)
@@ -152,6 +254,7 @@ class RenameItem:
                 self.source_path,
                 self.target_path,
                 overwrite_allowed=overwrite_allowed,
+                dir_fd=dir_fd,
             )
         except DestinationPathExists:
             self.__state = INDIRECTION_REQUIRED
@@ -165,7 +268,7 @@ class RenameItem:
         using a random uuid before the file name suffix
         """
         while True:
-            new_path = self.source_path.parent / (
+            new_path = self.directory_path / (
                 "%s.%s%s"
                 % (
                     self.source_path.stem,
@@ -179,7 +282,7 @@ class RenameItem:
             return new_path
         #
 
-    def rename_conflicting(self, overwrite_allowed=None):
+    def rename_conflicting(self, overwrite_allowed=None, dir_fd=None):
         """Rename source path to target_path in two steps
         if the target path already exists
         """
@@ -189,7 +292,9 @@ class RenameItem:
         if self.state == INDIRECTION_REQUIRED:
             # Pass 1 (INDIRECTION_REQUIRED)
             self.__intermediate_path = self.make_intermediate_path()
-            self.__rename_path(self.source_path, self.__intermediate_path)
+            self.__rename_path(
+                self.source_path, self.__intermediate_path, dir_fd=dir_fd
+            )
             self.__state = INDIRECTION_IN_PROGRESS
             raise FinalRenameRequired
         #
@@ -199,10 +304,13 @@ class RenameItem:
                 self.__intermediate_path,
                 self.target_path,
                 overwrite_allowed=overwrite_allowed,
+                dir_fd=dir_fd,
             )
         except DestinationPathExists:
             try:
-                self.__rename_path(self.__intermediate_path, self.source_path)
+                self.__rename_path(
+                    self.__intermediate_path, self.source_path, dir_fd=dir_fd
+                )
             except DestinationPathExists:
                 logging.warning(
                     "Possible race condition: cannot rename %r back to %r.",
@@ -279,80 +387,160 @@ class RenamingPlan:
     def __init__(self):
         """Initialize"""
         self.__unchanged_paths = set()
+        self.__source_paths = set()
+        self.__target_paths = set()
         self.__work_queue = collections.deque()
 
     @property
     def source_paths(self):
         """All source paths as a set"""
-        return {item.source_path for item in self.__work_queue}
+        return set(self.__source_paths)
 
     @property
     def target_paths(self):
         """All target paths as a set"""
-        return {item.target_path for item in self.__work_queue}
+        return set(self.__target_paths)
 
     def add(self, source_path, target_file_name):
         """Add the renaming of source_path to target_file_name"""
         rename_item = RenameItem(source_path, target_file_name)
         if (
-            rename_item.source_path
-            in self.source_paths | self.__unchanged_paths
+            rename_item.source_path in self.__source_paths
+            or rename_item.source_path in self.__unchanged_paths
         ):
             raise DuplicateSourcePath
         #
         if (
-            rename_item.target_path
-            in self.target_paths | self.__unchanged_paths
+            rename_item.target_path in self.__target_paths
+            or rename_item.target_path in self.__unchanged_paths
         ):
             raise DuplicateTargetPath
         #
         if rename_item.state == NO_RENAME_REQUIRED:
             self.__unchanged_paths.add(rename_item.source_path)
         else:
+            self.__source_paths.add(rename_item.source_path)
+            self.__target_paths.add(rename_item.target_path)
             self.__work_queue.append(rename_item)
         #
 
+    def extend(self, renamings):
+        """Add all renamings from an iterable of
+        (source_path, target_file_name) tuples.
+        Duplicates are detected using the path sets,
+        in constant time per renaming.
+        """
+        for (source_path, target_file_name) in renamings:
+            self.add(source_path, target_file_name)
+        #
+
+    def __clear(self):
+        """Clear the path sets after execution"""
+        self.__unchanged_paths.clear()
+        self.__source_paths.clear()
+        self.__target_paths.clear()
+
+    def __sort_work_queue(self):
+        """Sort the work queue so that each item is renamed
+        before the item using its source path as target path.
+        That way, renaming chains do not need any indirection,
+        only cycles do.
+        """
+        items_by_source = {
+            item.source_path: item for item in self.__work_queue
+        }
+        visited_paths = set()
+        sorted_items = []
+        for current_item in self.__work_queue:
+            chain = []
+            while (
+                current_item is not None
+                and current_item.source_path not in visited_paths
+            ):
+                visited_paths.add(current_item.source_path)
+                chain.append(current_item)
+                current_item = items_by_source.get(current_item.target_path)
+            #
+            sorted_items.extend(reversed(chain))
+        #
+        self.__work_queue = collections.deque(sorted_items)
+
     def execute(self, overwrite_allowed=None):
         """Execute the plan by renaming all files.
         If there are resolvable conflicts, use a temporary directory.
         Cleanup the plan and return a MassRenamingResult instance
         """
+        if not self.__work_queue:
+            self.__clear()
+            return MassRenamingResult()
+        #
+        self.__sort_work_queue()
         result = MassRenamingResult()
         overwrite_allowed = set(overwrite_allowed or [])
         resolver_queue = collections.deque()
-        while self.__work_queue:
-            current_item = self.__work_queue.popleft()
-            try:
-                current_item.do_rename(overwrite_allowed=overwrite_allowed)
-            except DestinationPathExists:
-                resolver_queue.append(current_item)
-            except OSError as error:
-                result.add_error(current_item, error)
-            else:
-                result.add_success(current_item)
+        # Local aliases for the methods used in the loops below
+        do_rename = RenameItem.do_rename
+        rename_conflicting = RenameItem.rename_conflicting
+        work_queue_popleft = self.__work_queue.popleft
+        resolver_queue_popleft = resolver_queue.popleft
+        resolver_queue_append = resolver_queue.append
+        add_success = result.add_success
+        add_conflict = result.add_conflict
+        add_error = result.add_error
+        with DirectoryDescriptors(
+            enabled=len(self.__work_queue) > DIR_FD_THRESHOLD
+        ) as directory_descriptors:
+            get_dir_fd = directory_descriptors.get
+            while self.__work_queue:
+                current_item = work_queue_popleft()
+                try:
+                    do_rename(
+                        current_item,
+                        overwrite_allowed=overwrite_allowed,
+                        dir_fd=get_dir_fd(current_item.directory_path),
+                    )
+                except DestinationPathExists:
+                    resolver_queue_append(current_item)
+                except OSError as error:
+                    add_error(current_item, error)
+                else:
+                    add_success(current_item)
+                #
+            #
+            # Resolve conflicts by using unique name appendices
+            if resolver_queue:
+                logging.debug("Trying to resolve name conflicts …")
             #
-        #
-        # Resolve conflicts by using unique name appendices
-        if resolver_queue:
-            logging.debug("Trying to resolve name conflicts …")
             while resolver_queue:
-                current_item = resolver_queue.popleft()
+                current_item = resolver_queue_popleft()
                 try:
-                    current_item.rename_conflicting(
-                        overwrite_allowed=overwrite_allowed
+                    rename_conflicting(
+                        current_item,
+                        overwrite_allowed=overwrite_allowed,
+                        dir_fd=get_dir_fd(current_item.directory_path),
                     )
                 except DestinationPathExists:
-                    result.add_conflict(current_item)
+                    add_conflict(current_item)
                 except FinalRenameRequired:
-                    resolver_queue.append(current_item)
+                    resolver_queue_append(current_item)
                 except OSError as error:
-                    result.add_error(current_item, error)
+                    add_error(current_item, error)
                 else:
-                    result.add_success(current_item)
+                    add_success(current_item)
                 #
             #
         #
-        self.__unchanged_paths.clear()
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(
+                "Renamed %d files: %s",
+                len(result.renamed_files),
+                ", ".join(
+                    "%r → %r" % (item.source_path.name, item.target_path.name)
+                    for item in result.renamed_files
+                ),
+            )
+        #
+        self.__clear()
         return result
 
     def __iter__(self):
@@ -24,8 +24,12 @@ If not, see <http://www.gnu.org/licenses/>.
 
 """
 
+import pathlib
+import tempfile
 import unittest
 
+from unittest import mock
+
 import mbdata
 
 
@@ -67,6 +71,138 @@ class TestSimple(unittest.TestCase):
             'It’s a Sin… ("keep quotes" mix)',
         )
 
+    def test_translate_dependent(self):
+        """Test sequential semantics of dependent translations"""
+        replacements = mbdata.TranslatorChain(
+            mbdata.Translator("bc", "X"),
+            mbdata.Translator("ab", "Y"),
+            mbdata.Translator("X", "Z"),
+        )
+        self.assertEqual(replacements.translate("abcbc"), "aZZ")
+        replacements.append(mbdata.Translator("a", "b"))
+        self.assertEqual(replacements.translate("abcbc"), "bZZ")
+
+    def test_translate_deletion(self):
+        """Test that a deletion is applied before a later
+        multi-character pattern, as in sequential application
+        """
+        translators = (
+            mbdata.Translator("--", ""),
+            mbdata.Translator("ab", "X"),
+        )
+        source_text = "a--b ab--"
+        expected_result = source_text
+        for single_translator in translators:
+            expected_result = single_translator.translate(expected_result)
+        #
+        self.assertEqual(expected_result, "X X")
+        self.assertEqual(
+            mbdata.TranslatorChain(*translators).translate(source_text),
+            expected_result,
+        )
+
+    def test_releases_from_id(self):
+        """Test release group detection in lookups by ID"""
+        mbid = "0b7ef1dc-8a3a-4e2b-9b9e-d1a6b1cbc4b8"
+        lookups = []
+
+        def release_from_id(release_mbid, local_release=None):
+            """Find no release"""
+            lookups.append(("release", release_mbid))
+            raise ValueError("No release in MusicBrainz with ID %r." % mbid)
+
+        def releases_from_release_group(group_mbid, local_release=None):
+            """Find two releases"""
+            lookups.append(("release-group", group_mbid))
+            return ["first", "second"]
+
+        #
+        with mock.patch.object(
+            mbdata, "release_from_id", release_from_id
+        ), mock.patch.object(
+            mbdata, "releases_from_release_group", releases_from_release_group
+        ):
+            self.assertEqual(
+                mbdata.releases_from_id(
+                    "https://musicbrainz.org/release-group/%s" % mbid
+                ),
+                ["first", "second"],
+            )
+            self.assertEqual(lookups, [("release-group", mbid)])
+            lookups.clear()
+            self.assertEqual(
+                mbdata.releases_from_id(mbid), ["first", "second"]
+            )
+            self.assertEqual(
+                lookups, [("release", mbid), ("release-group", mbid)]
+            )
+        #
+
+
+class TestRequestsCache(unittest.TestCase):
+
+    """Test the persistent requests cache"""
+
+    def setUp(self):
+        """Create a temporary directory and a call counter"""
+        self.__temp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = pathlib.Path(self.__temp_dir.name) / "sub" / "db"
+        self.calls = []
+
+    def tearDown(self):
+        """Remove the temporary directory"""
+        self.__temp_dir.cleanup()
+
+    def lookup(self, mbid, includes=None):
+        """Dummy lookup function recording its calls"""
+        self.calls.append(mbid)
+        return dict(id=mbid, includes=includes)
+
+    def test_cached_call(self):
+        """Test that repeated lookups are answered from the cache"""
+        cache = mbdata.RequestsCache(self.cache_path)
+        for _ in range(3):
+            self.assertEqual(
+                cache.call(self.lookup, "abc", includes=["media"]),
+                dict(id="abc", includes=["media"]),
+            )
+        #
+        cache.call(self.lookup, "def")
+        self.assertEqual(self.calls, ["abc", "def"])
+
+    def test_memory_cache(self):
+        """Test that results are answered from memory
+        without reading the database again
+        """
+        cache = mbdata.RequestsCache(self.cache_path)
+        first_result = cache.call(self.lookup, "abc")
+        self.cache_path.parent.rename(self.cache_path.parent.with_name("x"))
+        self.assertIs(cache.call(self.lookup, "abc"), first_result)
+        self.assertEqual(self.calls, ["abc"])
+        for mbid in range(mbdata.MEMORY_CACHE_SIZE):
+            cache.call(self.lookup, str(mbid))
+        #
+        cache.call(self.lookup, "abc")
+        self.assertEqual(len(self.calls), mbdata.MEMORY_CACHE_SIZE + 2)
+
+    def test_expired_and_disabled(self):
+        """Test expired entries and the disabled cache"""
+        cache = mbdata.RequestsCache(self.cache_path, max_age=0)
+        cache.call(self.lookup, "abc")
+        cache.call(self.lookup, "abc")
+        mbdata.RequestsCache().call(self.lookup, "abc")
+        self.assertEqual(self.calls, ["abc", "abc", "abc"])
+
+    def test_clear(self):
+        """Test that cleared entries are looked up again"""
+        cache = mbdata.RequestsCache(self.cache_path)
+        cache.call(self.lookup, "abc")
+        cache.clear()
+        cache.call(self.lookup, "abc")
+        self.assertEqual(self.calls, ["abc", "abc"])
+        mbdata.RequestsCache(self.cache_path).call(self.lookup, "abc")
+        self.assertEqual(self.calls, ["abc", "abc"])
+
 
 if __name__ == "__main__":
     unittest.main()
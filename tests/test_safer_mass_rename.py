@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+"""
+
+test safer_mass_rename
+
+Copyright (C) 2021 Rainer Schwarzbach
+
+This file is part of musicbrain.
+
+musicbrain is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+musicbrain is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with musicbrain (see LICENSE).
+If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import pathlib
+import tempfile
+import unittest
+
+import safer_mass_rename
+
+
+class TestSimple(unittest.TestCase):
+
+    """Test the module"""
+
+    def setUp(self):
+        """Create a temporary directory"""
+        self.__temp_dir = tempfile.TemporaryDirectory()
+        self.directory_path = pathlib.Path(self.__temp_dir.name)
+
+    def tearDown(self):
+        """Remove the temporary directory"""
+        self.__temp_dir.cleanup()
+
+    def make_files(self, *names):
+        """Create files containing their own names"""
+        for name in names:
+            (self.directory_path / name).write_text(name)
+        #
+
+    def read_files(self):
+        """Return a dict of file names and contents"""
+        return {
+            file_path.name: file_path.read_text()
+            for file_path in self.directory_path.iterdir()
+        }
+
+    def test_empty_plan(self):
+        """Test executing an empty plan"""
+        self.make_files("a.mp3")
+        renaming_plan = safer_mass_rename.RenamingPlan()
+        renaming_plan.add(self.directory_path / "a.mp3", "a.mp3")
+        self.assertEqual(len(renaming_plan), 0)
+        result = renaming_plan.execute()
+        self.assertEqual(len(result.renamed_files), 0)
+        self.assertEqual(self.read_files(), {"a.mp3": "a.mp3"})
+
+    def test_duplicate_paths(self):
+        """Test rejecting duplicate source and target paths"""
+        self.make_files("a.mp3", "b.mp3", "c.mp3")
+        renaming_plan = safer_mass_rename.RenamingPlan()
+        renaming_plan.add(self.directory_path / "a.mp3", "x.mp3")
+        renaming_plan.add(self.directory_path / "c.mp3", "c.mp3")
+        with self.assertRaises(safer_mass_rename.DuplicateSourcePath):
+            renaming_plan.add(self.directory_path / "a.mp3", "y.mp3")
+        #
+        with self.assertRaises(safer_mass_rename.DuplicateTargetPath):
+            renaming_plan.add(self.directory_path / "b.mp3", "x.mp3")
+        #
+        with self.assertRaises(safer_mass_rename.DuplicateTargetPath):
+            renaming_plan.add(self.directory_path / "b.mp3", "c.mp3")
+        #
+        self.assertEqual(
+            renaming_plan.source_paths, {self.directory_path / "a.mp3"}
+        )
+        renaming_plan.execute()
+        self.assertEqual(len(renaming_plan), 0)
+        self.assertEqual(renaming_plan.target_paths, set())
+
+    def test_swap_names(self):
+        """Test swapping file names via intermediate names"""
+        self.make_files("a.mp3", "b.mp3", "c.mp3")
+        renaming_plan = safer_mass_rename.RenamingPlan()
+        renaming_plan.add(self.directory_path / "a.mp3", "b.mp3")
+        renaming_plan.add(self.directory_path / "b.mp3", "a.mp3")
+        renaming_plan.add(self.directory_path / "c.mp3", "d.mp3")
+        result = renaming_plan.execute()
+        self.assertEqual(len(result.renamed_files), 3)
+        self.assertEqual(len(result.errors), 0)
+        self.assertEqual(
+            self.read_files(),
+            {"a.mp3": "b.mp3", "b.mp3": "a.mp3", "d.mp3": "c.mp3"},
+        )
+        for item in result.renamed_files:
+            self.assertEqual(item.state, safer_mass_rename.DONE)
+        #
+
+    def test_rename_chain(self):
+        """Test renaming a chain of names without indirection"""
+        self.make_files("a.mp3", "b.mp3", "c.mp3")
+        renaming_plan = safer_mass_rename.RenamingPlan()
+        renaming_plan.add(self.directory_path / "a.mp3", "b.mp3")
+        renaming_plan.add(self.directory_path / "b.mp3", "c.mp3")
+        renaming_plan.add(self.directory_path / "c.mp3", "d.mp3")
+        result = renaming_plan.execute()
+        self.assertEqual(len(result.renamed_files), 3)
+        self.assertEqual(
+            self.read_files(),
+            {"b.mp3": "a.mp3", "c.mp3": "b.mp3", "d.mp3": "c.mp3"},
+        )
+
+    def test_extend(self):
+        """Test adding renamings from an iterable"""
+        self.make_files("a.mp3", "b.mp3", "c.mp3")
+        renaming_plan = safer_mass_rename.RenamingPlan()
+        renaming_plan.extend(
+            (self.directory_path / name, name.replace("mp3", "ogg"))
+            for name in ("a.mp3", "b.mp3")
+        )
+        self.assertEqual(len(renaming_plan), 2)
+        with self.assertRaises(safer_mass_rename.DuplicateTargetPath):
+            renaming_plan.extend([(self.directory_path / "c.mp3", "a.ogg")])
+        #
+        result = renaming_plan.execute()
+        self.assertEqual(len(result.renamed_files), 2)
+        self.assertEqual(
+            self.read_files(),
+            {"a.ogg": "a.mp3", "b.ogg": "b.mp3", "c.mp3": "c.mp3"},
+        )
+
+    def test_rotate_many_names(self):
+        """Test rotating names in a plan exceeding DIR_FD_THRESHOLD"""
+        number_of_files = safer_mass_rename.DIR_FD_THRESHOLD + 4
+        names = ["%02d.mp3" % index for index in range(number_of_files)]
+        self.make_files(*names)
+        renaming_plan = safer_mass_rename.RenamingPlan()
+        for (index, name) in enumerate(names):
+            renaming_plan.add(self.directory_path / name, names[index - 1])
+        #
+        result = renaming_plan.execute()
+        self.assertEqual(len(result.renamed_files), number_of_files)
+        self.assertEqual(
+            self.read_files(),
+            {names[index - 1]: name for (index, name) in enumerate(names)},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+# vim:fileencoding=utf-8 autoindent ts=4 sw=4 sts=4 expandtab:
@@ -11,20 +11,26 @@ Update metadata from a MusicBrainz release
 """
 
 
-import argparse
+import collections
+import functools
 import logging
+import operator
 import os
 import pathlib
 
 # import re
 import sys
+import threading
 import tkinter
-import webbrowser
 
 from tkinter import filedialog
 from tkinter import messagebox
 from tkinter import ttk
 
+# non-standardlib modules
+
+import musicbrainzngs
+
 # local modules
 
 import gui_commons
@@ -58,6 +64,11 @@ PHASES = (
     RENAME_FILES,
 )
 
+# Lookup tables for phase numbers and adjacent phases
+PHASE_INDEX = {phase: index for (index, phase) in enumerate(PHASES)}
+NEXT_PHASE = dict(zip(PHASES, PHASES[1:]))
+PREVIOUS_PHASE = dict(zip(PHASES[1:], PHASES))
+
 PANEL_NAMES = {
     LOCAL_RELEASE_DATA: "Review / change local release data",
     SELECT_MB_RELEASE: "Select the matching release from MusicBrainz",
@@ -118,73 +129,177 @@ TYPOGRAPHY_FIXES = dict(
 
 
 def change_treeview_item_text(treeview, iid=None, text=None, select=True):
-    """Change the text of a ttk.Treeview item
-    by removing and reattaching it with the new text
-    """
-    parent_iid = treeview.parent(iid)
-    current_index = treeview.index(iid)
-    treeview.delete(iid)
-    treeview.insert(parent_iid, current_index, iid=iid, text=text)
+    """Change the text of a ttk.Treeview item in place"""
+    treeview.item(iid, text=text)
     if select:
         treeview.focus(iid)
         treeview.selection_set(iid)
     #
 
 
-def open_in_musicbrainz(release_id):
-    """Open the webbrowser and show a release in MusicBrainz"""
-    webbrowser.open(mbdata.FS_RELEASE_URL % mbdata.extract_id(release_id))
-
+def get_directory_state(directory_path):
+    """Return a tuple of the modification times (in nanoseconds)
+    of the directory itself and of the newest file in it
+    """
+    newest_file_mtime = 0
+    with os.scandir(directory_path) as entries:
+        for entry in entries:
+            if entry.is_file():
+                newest_file_mtime = max(
+                    newest_file_mtime, entry.stat().st_mtime_ns
+                )
+            #
+        #
+    #
+    return (os.stat(directory_path).st_mtime_ns, newest_file_mtime)
 
-#
-# Classes
-#
 
+def get_phase_methods(class_, prefix):
+    """Return a dict mapping phases to the (unbound) methods
+    of class_ named <prefix>_<phase>
+    """
+    phase_methods = {}
+    for phase in PHASES:
+        try:
+            phase_methods[phase] = getattr(class_, "%s_%s" % (prefix, phase))
+        except AttributeError:
+            continue
+        #
+    #
+    return phase_methods
 
-class Namespace(dict):
 
-    # pylint: disable=too-many-instance-attributes
+def open_in_musicbrainz(release_id):
+    """Open the webbrowser and show a release in MusicBrainz"""
+    # Imported on demand because it is rarely needed
+    # and pulls in subprocess, shlex etc. at startup
+    # pylint: disable=import-outside-toplevel
+    import webbrowser
 
-    """A dict subclass that exposes its items as attributes.
+    # webbrowser.open() may block until the browser has been started
+    threading.Thread(
+        target=webbrowser.open,
+        args=(mbdata.FS_RELEASE_URL % mbdata.extract_id(release_id),),
+        daemon=True,
+    ).start()
 
-    Warning: Namespace instances only have direct access to the
-    attributes defined in the visible_attributes tuple
-    """
 
-    visible_attributes = ("items",)
+#
+# Classes
+#
 
-    def __repr__(self):
-        """Object representation"""
-        return "{0}({1})".format(type(self).__name__, super().__repr__())
 
-    def __dir__(self):
-        """Members sequence"""
-        return tuple(self)
+class Variables:
+
+    """Hold the GUI state variables"""
+
+    __slots__ = (
+        "mbid_entry",
+        "album",
+        "albumartist",
+        "release_id",
+        "local_release",
+        "local_releases_cache",
+        "all_tracks",
+        "lookup_running",
+        "refresh_pending",
+        "current_phase",
+        "current_panel",
+        "directory_path",
+        "directory_display",
+        "disable_next_button",
+        "errors",
+        "errors_display",
+        "mb_releases",
+        "selected_mb_release",
+        "metadata_changes",
+        "metadata_lookup",
+        "metadata_translations",
+        "panel_display",
+        "changed_tracks",
+        "ignore_mb_data",
+        "always_include_artist",
+        "include_medium",
+        "renaming_plan",
+        "rename_result",
+        "typography_fixes",
+        "translator_chains",
+    )
 
-    def __getattribute__(self, name):
-        """Access a visible attribute
-        or return an existing dict member
+    def __init__(self, directory_path=None):
+        """Allocate variables
+        (requires an existing tkinter root window)
         """
-        if name in type(self).visible_attributes:
-            return object.__getattribute__(self, name)
-        #
-        try:
-            return self[name]
-        except KeyError as error:
-            raise AttributeError(
-                "{0!r} object has no attribute {1!r}".format(
-                    type(self).__name__, name
-                )
-            ) from error
-        #
-
-    def __setattr__(self, name, value):
-        """Set an attribute"""
-        self[name] = value
+        self.mbid_entry = tkinter.StringVar()
+        self.album = tkinter.StringVar()
+        self.albumartist = tkinter.StringVar()
+        self.release_id = tkinter.StringVar()
+        self.local_release = None
+        self.local_releases_cache = {}
+        self.all_tracks = []
+        self.lookup_running = False
+        self.refresh_pending = False
+        self.current_phase = CHOOSE_LOCAL_RELEASE
+        self.current_panel = None
+        self.directory_path = directory_path
+        self.directory_display = tkinter.StringVar()
+        self.disable_next_button = False
+        self.errors = []
+        self.errors_display = tkinter.StringVar()
+        self.mb_releases = []
+        self.selected_mb_release = None
+        self.metadata_changes = {}
+        self.metadata_lookup = {}
+        self.metadata_translations = {}
+        self.panel_display = tkinter.StringVar()
+        self.changed_tracks = {}
+        self.ignore_mb_data = tkinter.IntVar()
+        self.always_include_artist = tkinter.IntVar()
+        self.include_medium = tkinter.IntVar()
+        self.renaming_plan = None
+        self.rename_result = None
+        self.typography_fixes = [
+            ("single_quotes", tkinter.IntVar(value=0)),
+            ("apostrophe", tkinter.IntVar(value=1)),
+            ("quotes_as_inch", tkinter.IntVar(value=1)),
+            ("double_quotes", tkinter.IntVar(value=1)),
+            ("three_or_more_dots", tkinter.IntVar(value=0)),
+            ("exactly_three_dots", tkinter.IntVar(value=1)),
+        ]
+        self.translator_chains = {}
+
+
+class Widgets:
+
+    """Hold references to the GUI widgets changing between panels"""
+
+    __slots__ = (
+        "action_area",
+        "buttons_area",
+        "errors_frame",
+        "next_button",
+        "panel_frames",
+        "previous_button",
+        "metadata_view",
+        "release_view",
+        "translation_view",
+        "scroll_vertical",
+        "typography_fixes",
+    )
 
-    def __delattr__(self, name):
-        """Delete an attribute"""
-        del self[name]
+    def __init__(self):
+        """Allocate variables"""
+        self.action_area = None
+        self.buttons_area = None
+        self.errors_frame = None
+        self.next_button = None
+        self.panel_frames = {}
+        self.previous_button = None
+        self.metadata_view = None
+        self.release_view = None
+        self.translation_view = None
+        self.scroll_vertical = None
+        self.typography_fixes = {}
 
 
 class UserInterface(gui_commons.UserInterface):
@@ -196,10 +311,11 @@ class UserInterface(gui_commons.UserInterface):
 
     with_border = dict(borderwidth=2, padx=5, pady=5, relief=tkinter.GROOVE)
     grid_fullwidth = dict(padx=4, pady=2, sticky=tkinter.E + tkinter.W)
+    buttons_grid = dict(padx=5, pady=5, row=0)
 
     # pylint: disable=attribute-defined-outside-init
 
-    def __init__(self, directory_path):
+    def __init__(self, directory_path, use_cache=True, clear_cache=False):
         """Build the GUI"""
         super().__init__()
         # FIXME: hard-coded HiDPI scaling // does not change ttk widgets?
@@ -207,48 +323,14 @@ class UserInterface(gui_commons.UserInterface):
         mbdata.set_useragent(
             self.script_name, self.version, contact=gui_commons.HOMEPAGE
         )
-        self.variables = Namespace(
-            mbid_entry=tkinter.StringVar(),
-            album=tkinter.StringVar(),
-            albumartist=tkinter.StringVar(),
-            release_id=tkinter.StringVar(),
-            local_release=None,
-            current_phase=CHOOSE_LOCAL_RELEASE,
-            current_panel=None,
-            directory_path=directory_path,
-            directory_display=tkinter.StringVar(),
-            disable_next_button=False,
-            errors=[],
-            mb_releases=[],
-            selected_mb_release=None,
-            metadata_changes={},
-            metadata_lookup={},
-            metadata_translations={},
-            panel_display=tkinter.StringVar(),
-            changed_tracks={},
-            ignore_mb_data=tkinter.IntVar(),
-            # fix_typography=tkinter.IntVar(),
-            always_include_artist=tkinter.IntVar(),
-            include_medium=tkinter.IntVar(),
-            rename_result=None,
-            typography_fixes=[
-                ("single_quotes", tkinter.IntVar(value=0)),
-                ("apostrophe", tkinter.IntVar(value=1)),
-                ("quotes_as_inch", tkinter.IntVar(value=1)),
-                ("double_quotes", tkinter.IntVar(value=1)),
-                ("three_or_more_dots", tkinter.IntVar(value=0)),
-                ("exactly_three_dots", tkinter.IntVar(value=1)),
-            ],
-        )
-        self.widgets = Namespace(
-            action_area=None,
-            buttons_area=None,
-            metadata_view=None,
-            releases_view=None,
-            result_view=None,
-            scroll_vertical=None,
-            typography_fixes={},
-        )
+        if use_cache:
+            mbdata.set_cache()
+            if clear_cache:
+                mbdata.REQUESTS_CACHE.clear()
+            #
+        #
+        self.variables = Variables(directory_path=directory_path)
+        self.widgets = Widgets()
         overview_frame = tkinter.Frame(self.main_window)
         directory_label = tkinter.Label(overview_frame, text="Directory:")
         directory_label.grid(padx=4, pady=2, row=0, column=0, sticky=tkinter.W)
@@ -281,10 +363,21 @@ class UserInterface(gui_commons.UserInterface):
         )
         self.main_window.mainloop()
 
+    @property
+    def busy(self):
+        """True while a lookup is running or a panel refresh is pending.
+        Navigation is blocked in that state, because the actions
+        depend on the current panel’s widgets.
+        """
+        return self.variables.lookup_running or self.variables.refresh_pending
+
     def do_choose_local_release(
         self, keep_existing=False, preset_path=None, quit_on_empty_choice=False
     ):
         """Choose a release via file dialog"""
+        if self.busy:
+            return
+        #
         if preset_path:
             if not preset_path.is_dir():
                 preset_path = preset_path.parent
@@ -308,7 +401,7 @@ class UserInterface(gui_commons.UserInterface):
                 )
             #
             try:
-                self.variables.local_release = mbdata.local_release_from_path(
+                self.variables.local_release = self.read_local_release(
                     self.variables.directory_path
                 )
             except ValueError as error:
@@ -321,10 +414,11 @@ class UserInterface(gui_commons.UserInterface):
                 preset_path = self.variables.directory_path
                 continue
             #
-            total_number_of_tracks = sum(
-                medium.counted_tracks
-                for medium in self.variables.local_release.media_list
+            # Flatten the track list once per loaded release
+            self.variables.all_tracks = list(
+                self.variables.local_release.get_all_tracks()
             )
+            total_number_of_tracks = len(self.variables.all_tracks)
             self.variables.directory_display.set(
                 "%s (%s tracks)"
                 % (self.variables.directory_path.name, total_number_of_tracks)
@@ -335,6 +429,32 @@ class UserInterface(gui_commons.UserInterface):
             break
         #
 
+    def read_local_release(self, directory_path):
+        """Return the local release from directory_path,
+        re-using a previously read release if neither the directory
+        nor any of the files in it has been modified since
+        """
+        cache = self.variables.local_releases_cache
+        try:
+            directory_state = get_directory_state(directory_path)
+        except OSError:
+            # Let the release reader report the problem
+            return mbdata.local_release_from_path(directory_path)
+        #
+        try:
+            (cached_state, cached_release) = cache[directory_path]
+        except KeyError:
+            pass
+        else:
+            if cached_state == directory_state:
+                logging.debug("Re-using release read from %s", directory_path)
+                return cached_release
+            #
+        #
+        local_release = mbdata.local_release_from_path(directory_path)
+        cache[directory_path] = (directory_state, local_release)
+        return local_release
+
     def do_local_release_data(self):
         """Set local release data"""
         self.variables.album.set(self.variables.local_release.album or "")
@@ -348,47 +468,69 @@ class UserInterface(gui_commons.UserInterface):
         mbid_value = self.variables.mbid_entry.get()
         if mbid_value:
             try:
-                release_mbid = mbdata.extract_id(mbid_value)
+                mbdata.extract_id(mbid_value)
             except ValueError:
                 self.variables.errors.append(
                     "%r does not contain a valid"
                     " MusicBrainz ID." % mbid_value
                 )
             else:
-                try:
-                    self.variables.selected_mb_release = (
-                        mbdata.release_from_id(
-                            release_mbid,
-                            local_release=self.variables.local_release,
-                        )
-                    )
-                except ValueError as error:
-                    self.variables.errors.append(str(error))
-                else:
-                    self.variables.mb_releases.append(
-                        self.variables.selected_mb_release
-                    )
-                #
+                # Release group URLs and bare release group IDs
+                # are resolved to all releases of the release group
+                self.lookup_in_background(
+                    self.add_found_releases,
+                    mbdata.releases_from_id,
+                    mbid_value,
+                    local_release=self.variables.local_release,
+                )
             #
         else:
             # Get releases from musicbrainz
+            self.lookup_in_background(
+                self.add_found_releases,
+                mbdata.releases_from_search,
+                album=self.variables.album.get(),
+                albumartist=self.variables.albumartist.get(),
+                local_release=self.variables.local_release,
+            )
+        #
+
+    def lookup_in_background(self, callback, function, *args, **kwargs):
+        """Run a MusicBrainz lookup in a worker thread.
+        When it is done, call callback with the future
+        and show the current panel.
+        """
+        self.variables.lookup_running = True
+
+        def lookup_done(future):
+            """Process the result and show the panel"""
+            self.variables.lookup_running = False
             try:
-                self.variables.mb_releases.extend(
-                    sorted(
-                        mbdata.releases_from_search(
-                            album=self.variables.album.get(),
-                            albumartist=self.variables.albumartist.get(),
-                            local_release=self.variables.local_release,
-                        ),
-                        reverse=True,
-                    )
-                )
-            except ValueError as error:
-                self.variables.errors.append(str(error))
-            #
-            if not self.variables.mb_releases:
-                self.variables.errors.append("No matching releases found.")
+                callback(future)
+            finally:
+                self.request_panel_refresh()
             #
+
+        #
+        self.run_in_background(lookup_done, function, *args, **kwargs)
+
+    def add_found_releases(self, future):
+        """Add the releases from a finished search
+        or lookup by ID
+        """
+        try:
+            self.variables.mb_releases.extend(
+                sorted(
+                    future.result(),
+                    key=operator.attrgetter("score"),
+                    reverse=True,
+                )
+            )
+        except (ValueError, musicbrainzngs.WebServiceError) as error:
+            self.variables.errors.append(str(error))
+        #
+        if not self.variables.mb_releases:
+            self.variables.errors.append("No matching releases found.")
         #
 
     def do_confirm_translations(self):
@@ -400,30 +542,70 @@ class UserInterface(gui_commons.UserInterface):
             self.variables.disable_next_button = True
             return
         #
+        # Reuse complete releases from a release group lookup
+        # or from a previous lookup by ID
+        for release in self.variables.mb_releases:
+            if release.id_ == release_mbid and release.has_tracklists:
+                self.variables.selected_mb_release = release
+                break
+            #
+        #
         # Fetch data from MB only if they are not here yet
         if (
             not self.variables.selected_mb_release
             or self.variables.selected_mb_release.id_ != release_mbid
         ):
-            try:
-                self.variables.selected_mb_release = mbdata.release_from_id(
-                    release_mbid
-                )
-            except ValueError as error:
-                self.variables.errors.append(str(error))
-                self.variables.disable_next_button = True
-                return
+            self.lookup_in_background(
+                self.set_selected_release,
+                mbdata.release_from_id,
+                release_mbid,
+                local_release=self.variables.local_release,
+            )
+            return
+        #
+        self.translate_selected_release()
+
+    def set_selected_release(self, future):
+        """Set the selected release from a finished lookup by ID
+        and prepare its translations
+        """
+        try:
+            self.variables.selected_mb_release = future.result()
+        except (ValueError, musicbrainzngs.WebServiceError) as error:
+            self.variables.errors.append(str(error))
+            self.variables.disable_next_button = True
+            return
+        #
+        # Replace the incomplete search result by the complete release
+        for (index, release) in enumerate(self.variables.mb_releases):
+            if release == self.variables.selected_mb_release:
+                self.variables.mb_releases[
+                    index
+                ] = self.variables.selected_mb_release
+                break
             #
         #
+        self.translate_selected_release()
+
+    def translate_selected_release(self):
+        """Translate tag values of the selected release"""
         self.variables.ignore_mb_data.set(0)
         #
         # Translate tag values if typography fixes are required
         self.variables.selected_mb_release.clear_translations()
-        replacements = mbdata.TranslatorChain()
-        for (fix_name, is_selected) in self.variables.typography_fixes:
-            if is_selected.get():
-                replacements.append(TYPOGRAPHY_FIXES[fix_name])
-            #
+        # Re-use the chain (with its fused stages) for the same selection
+        selected_fixes = tuple(
+            fix_name
+            for (fix_name, is_selected) in self.variables.typography_fixes
+            if is_selected.get()
+        )
+        try:
+            replacements = self.variables.translator_chains[selected_fixes]
+        except KeyError:
+            replacements = mbdata.TranslatorChain(
+                *(TYPOGRAPHY_FIXES[fix_name] for fix_name in selected_fixes)
+            )
+            self.variables.translator_chains[selected_fixes] = replacements
         #
         self.variables.selected_mb_release.translate(replacements)
         #
@@ -445,7 +627,7 @@ class UserInterface(gui_commons.UserInterface):
         """Prepare Metadata change"""
         # Build map of metadata changes per track
         self.variables.metadata_changes.clear()
-        for track in self.variables.local_release.get_all_tracks():
+        for track in self.variables.all_tracks:
             try:
                 changes = mbdata.LocalTrackChanges(
                     track, self.variables.selected_mb_release
@@ -480,7 +662,8 @@ class UserInterface(gui_commons.UserInterface):
         if self.variables.ignore_mb_data.get():
             self.variables.metadata_changes.clear()
         #
-        for track in self.variables.local_release.get_all_tracks():
+        log_changes = logging.getLogger().isEnabledFor(logging.DEBUG)
+        for track in self.variables.all_tracks:
             file_name = track.file_path.name
             try:
                 changes = self.variables.metadata_changes[file_name]
@@ -491,12 +674,15 @@ class UserInterface(gui_commons.UserInterface):
             else:
                 applied_changes = changes.apply()
             #
-            if applied_changes:
+            if not applied_changes:
+                continue
+            #
+            if log_changes:
                 logging.debug(
                     "Applied changes for %r: %r", file_name, applied_changes
                 )
-                self.variables.changed_tracks[file_name] = applied_changes
             #
+            self.variables.changed_tracks[file_name] = applied_changes
         #
         if not self.variables.changed_tracks:
             self.variables.errors.append("No metadata changes done.")
@@ -509,19 +695,18 @@ class UserInterface(gui_commons.UserInterface):
     def do_confirm_rename(self):
         """Prepare file mass rename"""
         self.variables.renaming_plan = safer_mass_rename.RenamingPlan()
-        for track in self.variables.local_release.get_all_tracks():
-            self.variables.renaming_plan.add(
+        include_artist_name = bool(self.variables.always_include_artist.get())
+        include_medium_number = bool(self.variables.include_medium.get())
+        self.variables.renaming_plan.extend(
+            (
                 track.file_path,
                 track.suggested_filename(
-                    include_artist_name=bool(
-                        self.variables.always_include_artist.get()
-                    ),
-                    include_medium_number=bool(
-                        self.variables.include_medium.get()
-                    ),
+                    include_artist_name=include_artist_name,
+                    include_medium_number=include_medium_number,
                 ),
             )
-        #
+            for track in self.variables.all_tracks
+        )
         if not self.variables.renaming_plan:
             self.variables.errors.append("No files need to be renamed.")
             self.variables.disable_next_button = True
@@ -532,12 +717,23 @@ class UserInterface(gui_commons.UserInterface):
         self.variables.rename_result = self.variables.renaming_plan.execute()
 
     def panel_local_release_data(self):
-        """Show the local release’s title and artist"""
+        """Show the local release’s title and artist.
+        The panel only contains widgets bound to tkinter variables,
+        so it is built once and re-used on subsequent visits.
+        """
+        try:
+            panel_frame = self.widgets.panel_frames[LOCAL_RELEASE_DATA]
+        except KeyError:
+            panel_frame = tkinter.Frame(self.widgets.action_area)
+            panel_frame.columnconfigure(0, weight=1)
+            self.widgets.panel_frames[LOCAL_RELEASE_DATA] = panel_frame
+        else:
+            panel_frame.grid(sticky=tkinter.E + tkinter.W)
+            return
+        #
         label_grid = dict(column=0, padx=4, sticky=tkinter.E)
         value_grid = dict(column=1, columnspan=3, padx=4, sticky=tkinter.W)
-        search_frame = tkinter.Frame(
-            self.widgets.action_area, **self.with_border
-        )
+        search_frame = tkinter.Frame(panel_frame, **self.with_border)
         search_label = tkinter.Label(
             search_frame,
             text="Search the release in MusicBrainz" " by the following data:",
@@ -567,12 +763,11 @@ class UserInterface(gui_commons.UserInterface):
         )
         artist_value.grid(row=2, **value_grid)
         search_frame.grid(**self.grid_fullwidth)
-        direct_entry_frame = tkinter.Frame(
-            self.widgets.action_area, **self.with_border
-        )
+        direct_entry_frame = tkinter.Frame(panel_frame, **self.with_border)
         mbid_label = tkinter.Label(
             direct_entry_frame,
-            text="… or specify a MusicBrainz release directly by its ID:",
+            text="… or specify a MusicBrainz release"
+            " (or release group) directly by its ID:",
             justify=tkinter.LEFT,
         )
         mbid_label.grid(sticky=tkinter.W, padx=4, pady=2)
@@ -584,6 +779,7 @@ class UserInterface(gui_commons.UserInterface):
         )
         mbid_value.grid(sticky=tkinter.W, padx=4, pady=2)
         direct_entry_frame.grid(**self.grid_fullwidth)
+        panel_frame.grid(sticky=tkinter.E + tkinter.W)
 
     def panel_select_mb_release(self):
         """Panel with Musicbrainz release selection"""
@@ -594,7 +790,6 @@ class UserInterface(gui_commons.UserInterface):
         select_frame = tkinter.Frame(
             self.widgets.action_area, **self.with_border
         )
-        release_iids = {}
         label = tkinter.Label(
             select_frame,
             text="Please select a release and hit the “next” button"
@@ -615,37 +810,36 @@ class UserInterface(gui_commons.UserInterface):
             "<Double-Button-1>", self.open_selected_release
         )
         self.widgets.release_view.bind("<Return>", self.open_selected_release)
+        # Group releases by (caseless) artist and title
+        release_groups = collections.defaultdict(list)
         for single_release in self.variables.mb_releases:
-            release_full_name = "%s – %s" % (
-                single_release[mbdata.ALBUMARTIST],
-                single_release[mbdata.ALBUM],
+            release_full_name = (
+                f"{single_release[mbdata.ALBUMARTIST]}"
+                f" – {single_release[mbdata.ALBUM]}"
             )
-            try:
-                parent_iid = release_iids[release_full_name.lower()]
-            except KeyError:
-                parent_iid = self.widgets.release_view.insert(
-                    "", tkinter.END, open=True, text=release_full_name
-                )
-                release_iids[release_full_name.lower()] = parent_iid
-            #
-            self.widgets.release_view.insert(
-                parent_iid,
-                tkinter.END,
-                iid=single_release.id_,
-                text="[%s%%] %s, %s"
-                % (
-                    single_release.score,
-                    single_release.date or "<unknown date>",
-                    single_release.summary,
-                ),
+            release_groups[release_full_name.casefold()].append(
+                (release_full_name, single_release)
             )
-            #
-            # Focus and select the first release
-            if not self.widgets.release_view.focus():
-                self.widgets.release_view.focus(single_release.id_)
-                self.widgets.release_view.selection_set(single_release.id_)
+        #
+        for group in release_groups.values():
+            parent_iid = self.widgets.release_view.insert(
+                "", tkinter.END, open=True, text=group[0][0]
+            )
+            for (_, single_release) in group:
+                self.widgets.release_view.insert(
+                    parent_iid,
+                    tkinter.END,
+                    iid=single_release.id_,
+                    text=f"[{single_release.score}%]"
+                    f" {single_release.date or '<unknown date>'},"
+                    f" {single_release.summary}",
+                )
             #
         #
+        # Focus and select the first release
+        first_release_id = self.variables.mb_releases[0].id_
+        self.widgets.release_view.focus(first_release_id)
+        self.widgets.release_view.selection_set(first_release_id)
         self.widgets.scroll_vertical = tkinter.Scrollbar(
             select_frame,
             orient=tkinter.VERTICAL,
@@ -714,21 +908,25 @@ class UserInterface(gui_commons.UserInterface):
             "<Double-Button-1>", self.toggle_translation
         )
         self.widgets.translation_view.bind("<Return>", self.toggle_translation)
-        release_iid = None
+        release_iid = self.widgets.translation_view.insert(
+            "", tkinter.END, open=True, text=str(mb_release)
+        )
+        # Tree view iids and MusicBrainz objects of media and tracks,
+        # determined once per medium and track
         media_iids = {}
-        track_iids = {}
+        tracks = {}
         for accessor in mb_release.translated_accessors:
-            if not release_iid:
-                release_iid = self.widgets.translation_view.insert(
-                    "", tkinter.END, open=True, text=str(mb_release)
-                )
-            #
-            description = mb_release.get_description(**accessor)
+            tag_name = accessor["tag_name"]
             try:
                 track_number = accessor[mbdata.TRACK_NUMBER]
             except KeyError:
+                locator = dict(accessor)
+                del locator["tag_name"]
+                translatable = mb_release.get_object(**locator)
                 current_iid = self.widgets.translation_view.insert(
-                    release_iid, tkinter.END, text=description
+                    release_iid,
+                    tkinter.END,
+                    text=translatable.describe(tag_name),
                 )
             else:
                 try:
@@ -742,22 +940,21 @@ class UserInterface(gui_commons.UserInterface):
                     try:
                         medium_iid = media_iids[medium_number]
                     except KeyError:
+                        mb_medium = mb_release.get_object(
+                            medium_number=medium_number
+                        )
                         medium_iid = self.widgets.translation_view.insert(
                             release_iid,
                             tkinter.END,
                             open=True,
-                            text="%s #%s"
-                            % (
-                                mb_release.get_object(
-                                    medium_number=medium_number
-                                ).format,
-                                medium_number,
-                            ),
+                            text=f"{mb_medium.format} #{medium_number}",
                         )
                         media_iids[medium_number] = medium_iid
                     #
                     try:
-                        track_iid = track_iids[(medium_number, track_number)]
+                        (track_iid, mb_track) = tracks[
+                            (medium_number, track_number)
+                        ]
                     except KeyError:
                         mb_track = mb_release.get_object(
                             medium_number=medium_number,
@@ -767,21 +964,28 @@ class UserInterface(gui_commons.UserInterface):
                             medium_iid,
                             tkinter.END,
                             open=True,
-                            text="%02d. %s – %s"
-                            % (
-                                mb_track.track_number,
-                                mb_track[mbdata.ARTIST],
-                                mb_track[mbdata.TITLE],
-                            ),
+                            text=f"{mb_track.track_number:02d}."
+                            f" {mb_track[mbdata.ARTIST]}"
+                            f" – {mb_track[mbdata.TITLE]}",
+                        )
+                        tracks[(medium_number, track_number)] = (
+                            track_iid,
+                            mb_track,
                         )
-                        track_iids[(medium_number, track_number)] = track_iid
                     #
+                    translatable = mb_track
                     current_iid = self.widgets.translation_view.insert(
-                        track_iid, tkinter.END, text=description
+                        track_iid,
+                        tkinter.END,
+                        text=mb_track.describe(tag_name),
                     )
                 #
             #
-            self.variables.metadata_translations[current_iid] = accessor
+            # Keep a direct reference to the translatable object
+            self.variables.metadata_translations[current_iid] = (
+                translatable,
+                tag_name,
+            )
         #
         self.widgets.scroll_vertical = tkinter.Scrollbar(
             select_frame,
@@ -826,19 +1030,32 @@ class UserInterface(gui_commons.UserInterface):
             "<Double-Button-1>", self.toggle_tag_value
         )
         self.widgets.metadata_view.bind("<Return>", self.toggle_tag_value)
-        for (
-            file_name,
-            single_change,
-        ) in self.variables.metadata_changes.items():
+        # Render all display texts before filling the tree view
+        rendered_changes = [
+            (
+                file_name,
+                single_change,
+                list(single_change.iter_display()),
+            )
+            for (
+                file_name,
+                single_change,
+            ) in self.variables.metadata_changes.items()
+        ]
+        for (file_name, single_change, tag_rows) in rendered_changes:
             track_iid = self.widgets.metadata_view.insert(
                 "", tkinter.END, open=True, text=file_name
             )
             #
-            for tag_key in single_change.keys():
+            for (tag_key, text) in tag_rows:
                 tag_iid = self.widgets.metadata_view.insert(
-                    track_iid, tkinter.END, text=single_change.display(tag_key)
+                    track_iid, tkinter.END, text=text
+                )
+                # Keep a direct reference to the changes object
+                self.variables.metadata_lookup[tag_iid] = (
+                    single_change,
+                    tag_key,
                 )
-                self.variables.metadata_lookup[tag_iid] = (file_name, tag_key)
             #
         #
         self.widgets.scroll_vertical = tkinter.Scrollbar(
@@ -868,7 +1085,7 @@ class UserInterface(gui_commons.UserInterface):
         """Panel with Metadata changes summary
         and renaming options
         """
-        logging.debug(self.variables.changed_tracks)
+        logging.debug("Changed tracks: %r", self.variables.changed_tracks)
         if self.variables.changed_tracks:
             select_frame = tkinter.Frame(
                 self.widgets.action_area, **self.with_border
@@ -963,7 +1180,7 @@ class UserInterface(gui_commons.UserInterface):
             result_view.insert(
                 track_iid,
                 tkinter.END,
-                text="→ %s" % rename_item.target_path.name,
+                text=f"→ {rename_item.target_path.name}",
             )
             #
         #
@@ -996,49 +1213,85 @@ class UserInterface(gui_commons.UserInterface):
             show="tree",
         )
         result_view.column("#0", width=700)
-        number_success = len(self.variables.rename_result.renamed_files)
-        conflicts = len(self.variables.rename_result.conflicts)
-        errors = len(self.variables.rename_result.errors)
-        success_iid = result_view.insert(
-            "",
-            tkinter.END,
-            open=False,
-            text="Renamed files (%s)" % number_success,
-        )
-        for rename_item in self.variables.rename_result.renamed_files:
-            file_iid = result_view.insert(
-                success_iid,
-                tkinter.END,
-                open=True,
-                text="%s" % rename_item.source_path.name,
-            )
-            result_view.insert(
-                file_iid,
-                tkinter.END,
-                text="→ %s" % rename_item.target_path.name,
+        rename_result = self.variables.rename_result
+        # The groups are shown collapsed, so their children
+        # are only inserted when a group is opened for the first time.
+        # Until then, each group contains a single placeholder item.
+        group_fillers = {}
+
+        def fill_renamed_files(group_iid):
+            """Insert the renamed files"""
+            for rename_item in rename_result.renamed_files:
+                file_iid = result_view.insert(
+                    group_iid,
+                    tkinter.END,
+                    open=True,
+                    text=rename_item.source_path.name,
+                )
+                result_view.insert(
+                    file_iid,
+                    tkinter.END,
+                    text=f"→ {rename_item.target_path.name}",
+                )
+            #
+
+        def fill_messages(group_iid, get_messages):
+            """Insert the messages"""
+            for message in get_messages():
+                result_view.insert(group_iid, tkinter.END, text=message)
+            #
+
+        def add_group(text, group_filler=None):
+            """Add a collapsed group,
+            with a placeholder item if a filler was given
+            """
+            group_iid = result_view.insert(
+                "", tkinter.END, open=False, text=text
             )
+            if group_filler:
+                result_view.insert(group_iid, tkinter.END, text="…")
+                group_fillers[group_iid] = group_filler
             #
+
+        def group_opened(event=None):
+            """Replace the placeholder of the opened group"""
+            del event
+            group_iid = result_view.focus()
+            try:
+                group_filler = group_fillers.pop(group_iid)
+            except KeyError:
+                return
+            #
+            result_view.delete(*result_view.get_children(group_iid))
+            group_filler(group_iid)
+
         #
-        if conflicts:
-            conflicts_iid = result_view.insert(
-                "",
-                tkinter.END,
-                open=False,
-                text="Name conflicts (%s)" % conflicts,
+        result_view.bind("<<TreeviewOpen>>", group_opened)
+        if rename_result.renamed_files:
+            add_group(
+                "Renamed files (%s)" % len(rename_result.renamed_files),
+                fill_renamed_files,
             )
-            for (
-                message
-            ) in self.variables.rename_result.get_conflict_messages():
-                result_view.insert(conflicts_iid, tkinter.END, text=message)
-            #
+        else:
+            add_group("Renamed files (0)")
         #
-        if errors:
-            errors_iid = result_view.insert(
-                "", tkinter.END, open=False, text="Errors (%s)" % errors
+        if rename_result.conflicts:
+            add_group(
+                "Name conflicts (%s)" % len(rename_result.conflicts),
+                functools.partial(
+                    fill_messages,
+                    get_messages=rename_result.get_conflict_messages,
+                ),
+            )
+        #
+        if rename_result.errors:
+            add_group(
+                "Errors (%s)" % len(rename_result.errors),
+                functools.partial(
+                    fill_messages,
+                    get_messages=rename_result.get_error_messages,
+                ),
             )
-            for message in self.variables.rename_result.get_error_messages():
-                result_view.insert(errors_iid, tkinter.END, text=message)
-            #
         #
         self.widgets.scroll_vertical = tkinter.Scrollbar(
             select_frame, orient=tkinter.VERTICAL, command=result_view.yview
@@ -1053,35 +1306,43 @@ class UserInterface(gui_commons.UserInterface):
 
     def next_action(self):
         """Execute the next action"""
-        next_index = PHASES.index(self.variables.current_panel) + 1
-        try:
-            next_phase = PHASES[next_index]
-        except IndexError:
+        next_index = PHASE_INDEX[self.variables.current_panel] + 1
+        next_phase = NEXT_PHASE.get(self.variables.current_panel)
+        if next_phase is None:
             self.variables.errors.append(
                 "Phase number #%s out of range" % next_index
             )
+            return
         #
-        try:
-            action_method = getattr(self, "do_%s" % next_phase)
-        except AttributeError:
+        action_method = self.action_methods.get(next_phase)
+        if action_method is None:
             self.variables.errors.append(
                 "Action method for phase #%s (%r)"
                 " has not been defined yet" % (next_index, next_phase)
             )
+            return
+        #
+        self.variables.current_phase = next_phase
+        try:
+            action_method(self)
         except NotImplementedError:
             self.variables.errors.append(
                 "Action method for phase #%s (%r)"
                 " has not been implemented yet" % (next_index, next_phase)
             )
-        else:
-            self.variables.current_phase = next_phase
-            action_method()
         #
 
     def next_panel(self):
-        """Execute the next action and go to the next panel"""
+        """Execute the next action and go to the next panel
+        (delayed until a MusicBrainz lookup started by the action is done)
+        """
+        if self.busy:
+            return
+        #
         self.next_action()
-        self.__show_panel()
+        if not self.variables.lookup_running:
+            self.request_panel_refresh()
+        #
 
     def open_selected_release(self, event=None):
         """Open a the selected release in MusicBrainz"""
@@ -1094,21 +1355,25 @@ class UserInterface(gui_commons.UserInterface):
 
     def previous_panel(self):
         """Go to the next panel"""
-        phase_index = PHASES.index(self.variables.current_panel)
-        try:
-            rollback_method = getattr(
-                self, "rollback_%s" % self.variables.current_panel
-            )
-        except AttributeError:
+        if self.busy:
+            return
+        #
+        phase_index = PHASE_INDEX[self.variables.current_panel]
+        rollback_method = self.rollback_methods.get(
+            self.variables.current_panel
+        )
+        if rollback_method is None:
             self.variables.errors.append(
                 "Rollback method for phase #%s (%r)"
                 " has not been defined yet"
                 % (phase_index, self.variables.current_panel)
             )
         else:
-            self.variables.current_phase = PHASES[phase_index - 1]
+            self.variables.current_phase = PREVIOUS_PHASE[
+                self.variables.current_panel
+            ]
             try:
-                rollback_method()
+                rollback_method(self)
             except NotImplementedError:
                 self.variables.errors.append(
                     "Rollback method for phase #%s (%r)"
@@ -1117,7 +1382,17 @@ class UserInterface(gui_commons.UserInterface):
                 )
             #
         #
-        self.__show_panel()
+        self.request_panel_refresh()
+
+    def request_panel_refresh(self):
+        """Show the current panel when the event loop is idle.
+        Multiple requests before that are coalesced into a single
+        rebuild of the action area.
+        """
+        if not self.variables.refresh_pending:
+            self.variables.refresh_pending = True
+            self.main_window.after_idle(self.__refresh_panel)
+        #
 
     def rollback_select_mb_release(self):
         """Clear releases explicitly"""
@@ -1151,90 +1426,132 @@ class UserInterface(gui_commons.UserInterface):
     def toggle_tag_value(self, event=None):
         """Toggle the selected tag value (source)"""
         del event
-        tag_iid = self.widgets.metadata_view.focus()
-        try:
-            (track_file_name, tag_name) = self.variables.metadata_lookup[
-                tag_iid
-            ]
-        except ValueError:
-            pass
-        else:
-            # Delete and reattach the tag change
-            changes = self.variables.metadata_changes[track_file_name]
-            changes.toggle_source(tag_name)
-            change_treeview_item_text(
-                self.widgets.metadata_view,
-                iid=tag_iid,
-                text=changes.display(tag_name),
-            )
+        metadata_view = self.widgets.metadata_view
+        tag_iid = metadata_view.focus()
+        # Track rows are not in the lookup table
+        tag_location = self.variables.metadata_lookup.get(tag_iid)
+        if tag_location is None:
+            return
         #
+        (changes, tag_name) = tag_location
+        changes.toggle_source(tag_name)
+        change_treeview_item_text(
+            metadata_view, iid=tag_iid, text=changes.display(tag_name)
+        )
 
     def toggle_translation(self, event=None):
         """Toggle the selected MusicBrainz tag translation"""
         del event
-        tag_iid = self.widgets.translation_view.focus()
-        try:
-            locator = dict(self.variables.metadata_translations[tag_iid])
-        except ValueError:
-            pass
-        else:
-            tag_name = locator.pop("tag_name")
-            translatable = self.variables.selected_mb_release.get_object(
-                **locator
-            )
-            translatable.toggle_translation(tag_name)
-            change_treeview_item_text(
-                self.widgets.translation_view,
-                iid=tag_iid,
-                text=translatable.describe(tag_name),
-            )
+        translation_view = self.widgets.translation_view
+        tag_iid = translation_view.focus()
+        # Release, medium and track rows are not in the lookup table
+        tag_location = self.variables.metadata_translations.get(tag_iid)
+        if tag_location is None:
+            return
         #
+        (translatable, tag_name) = tag_location
+        translatable.toggle_translation(tag_name)
+        change_treeview_item_text(
+            translation_view, iid=tag_iid, text=translatable.describe(tag_name)
+        )
+
+    def __refresh_panel(self):
+        """Show the panel as requested via request_panel_refresh()"""
+        self.variables.refresh_pending = False
+        self.__show_panel()
 
     def __show_errors(self):
         """Show errors if there are any"""
         if self.variables.errors:
-            errors_frame = tkinter.Frame(
-                self.widgets.action_area, **self.with_border
+            self.variables.errors_display.set(
+                "\n".join(self.variables.errors)
             )
-            for message in self.variables.errors:
-                error_value = tkinter.Label(
-                    errors_frame, text=message, justify=tkinter.LEFT
-                )
-                error_value.grid(padx=4, sticky=tkinter.W)
-            #
             self.variables.errors.clear()
-            errors_frame.grid(**self.grid_fullwidth)
+            self.widgets.errors_frame.grid(**self.grid_fullwidth)
         #
 
-    def __show_panel(self):
-        """Show a panel.
-        Add the "Previous", "Next", "Choose another relase",
-        "About" and "Quit" buttons at the bottom
+    def __build_areas(self):
+        """Build the action area with the (initially hidden)
+        errors frame, and the buttons area
+        including the "Previous" and "Next" buttons
         """
-        for area in ("action_area", "buttons_area"):
-            try:
-                self.widgets[area].grid_forget()
-            except AttributeError:
-                pass
-            #
-        #
         self.widgets.action_area = tkinter.Frame(
             self.main_window, **self.with_border
         )
-        try:
-            panel_method = getattr(
-                self, "panel_%s" % self.variables.current_phase
-            )
-        except AttributeError:
+        self.widgets.action_area.grid(**self.grid_fullwidth)
+        self.widgets.errors_frame = tkinter.Frame(
+            self.widgets.action_area, **self.with_border
+        )
+        errors_label = tkinter.Label(
+            self.widgets.errors_frame,
+            textvariable=self.variables.errors_display,
+            justify=tkinter.LEFT,
+        )
+        errors_label.grid(padx=4, sticky=tkinter.W)
+        self.widgets.buttons_area = tkinter.Frame(
+            self.main_window, **self.with_border
+        )
+        self.widgets.previous_button = tkinter.Button(
+            self.widgets.buttons_area,
+            text="\u25c1 Previous",
+            command=self.previous_panel,
+        )
+        self.widgets.previous_button.grid(
+            column=0, sticky=tkinter.W, **self.buttons_grid
+        )
+        self.widgets.next_button = tkinter.Button(
+            self.widgets.buttons_area,
+            text="\u25b7 Next",
+            command=self.next_panel,
+        )
+        self.widgets.next_button.grid(
+            column=1, sticky=tkinter.W, **self.buttons_grid
+        )
+        self.widgets.buttons_area.columnconfigure(2, weight=100)
+        self.widgets.buttons_area.grid(**self.grid_fullwidth)
+        self.main_window.after_idle(self.__build_secondary_buttons)
+
+    def __build_secondary_buttons(self):
+        """Add the "About" and "Quit" buttons
+        (deferred until the first panel has been shown)
+        """
+        about_button = tkinter.Button(
+            self.widgets.buttons_area, text="About…", command=self.show_about
+        )
+        about_button.grid(column=3, sticky=tkinter.E, **self.buttons_grid)
+        quit_button = tkinter.Button(
+            self.widgets.buttons_area, text="Quit", command=self.quit
+        )
+        quit_button.grid(column=4, sticky=tkinter.E, **self.buttons_grid)
+
+    def __show_panel(self):
+        """Show a panel in the action area
+        and set the states of the "Previous" and "Next" buttons.
+        The areas and buttons are built only once,
+        subsequent calls just replace the action area contents.
+        """
+        if self.widgets.action_area is None:
+            self.__build_areas()
+        else:
+            cached_frames = set(self.widgets.panel_frames.values())
+            cached_frames.add(self.widgets.errors_frame)
+            for child_widget in self.widgets.action_area.winfo_children():
+                if child_widget in cached_frames:
+                    child_widget.grid_forget()
+                else:
+                    child_widget.destroy()
+                #
+            #
+        #
+        panel_method = self.panel_methods.get(self.variables.current_phase)
+        if panel_method is None:
             self.variables.errors.append(
                 "Panel for Phase %r has not been implemented yet,"
                 " going back to phase %r."
                 % (self.variables.current_phase, self.variables.current_panel)
             )
             self.variables.current_phase = self.variables.current_panel
-            panel_method = getattr(
-                self, "panel_%s" % self.variables.current_phase
-            )
+            panel_method = self.panel_methods[self.variables.current_phase]
             self.variables.disable_next_button = False
         else:
             self.variables.current_panel = self.variables.current_phase
@@ -1243,65 +1560,37 @@ class UserInterface(gui_commons.UserInterface):
             "%s (panel %s of %s)"
             % (
                 PANEL_NAMES[self.variables.current_panel],
-                PHASES.index(self.variables.current_panel),
+                PHASE_INDEX[self.variables.current_panel],
                 len(PHASES) - 1,
             )
         )
         self.__show_errors()
-        panel_method()
-        self.widgets.action_area.grid(**self.grid_fullwidth)
-        #
-        self.widgets.buttons_area = tkinter.Frame(
-            self.main_window, **self.with_border
-        )
+        panel_method(self)
         #
-        buttons_grid = dict(padx=5, pady=5, row=0)
-        if self.variables.current_phase in (
-            SELECT_MB_RELEASE,
-            CONFIRM_TRANSLATIONS,
-            CONFIRM_METADATA,
-            RENAME_OPTIONS,
-            CONFIRM_RENAME,
-            RENAME_FILES,
-        ):
+        # Going back is possible from all phases that can be rolled back
+        if self.variables.current_phase in self.rollback_methods:
             previous_button_state = tkinter.NORMAL
         else:
             previous_button_state = tkinter.DISABLED
         #
-        previous_button = tkinter.Button(
-            self.widgets.buttons_area,
-            text="\u25c1 Previous",
-            command=self.previous_panel,
-            state=previous_button_state,
-        )
-        previous_button.grid(column=0, sticky=tkinter.W, **buttons_grid)
-        #
+        self.widgets.previous_button.configure(state=previous_button_state)
+        # Going forward is possible from all but the last phase
         if (
             self.variables.disable_next_button
-            or self.variables.current_phase == RENAME_FILES
+            or self.variables.current_phase not in NEXT_PHASE
         ):
             next_button_state = tkinter.DISABLED
         else:
             next_button_state = tkinter.NORMAL
         #
         self.variables.disable_next_button = False
-        next_button = tkinter.Button(
-            self.widgets.buttons_area,
-            text="\u25b7 Next",
-            command=self.next_panel,
-            state=next_button_state,
-        )
-        next_button.grid(column=1, sticky=tkinter.W, **buttons_grid)
-        about_button = tkinter.Button(
-            self.widgets.buttons_area, text="About…", command=self.show_about
-        )
-        about_button.grid(column=3, sticky=tkinter.E, **buttons_grid)
-        quit_button = tkinter.Button(
-            self.widgets.buttons_area, text="Quit", command=self.quit
-        )
-        quit_button.grid(column=4, sticky=tkinter.E, **buttons_grid)
-        self.widgets.buttons_area.columnconfigure(2, weight=100)
-        self.widgets.buttons_area.grid(**self.grid_fullwidth)
+        self.widgets.next_button.configure(state=next_button_state)
+
+
+# Build the phase dispatch tables once
+UserInterface.action_methods = get_phase_methods(UserInterface, "do")
+UserInterface.panel_methods = get_phase_methods(UserInterface, "panel")
+UserInterface.rollback_methods = get_phase_methods(UserInterface, "rollback")
 
 
 #
@@ -1311,6 +1600,11 @@ class UserInterface(gui_commons.UserInterface):
 
 def __get_arguments():
     """Parse command line arguments"""
+    # Imported here because it is not needed when called
+    # as a Nautilus script
+    # pylint: disable=import-outside-toplevel
+    import argparse
+
     argument_parser = argparse.ArgumentParser(
         description="Get and print data from a musicbrainz release"
     )
@@ -1339,16 +1633,33 @@ def __get_arguments():
         " (defaults to the current directory, in this case:"
         "%(default)s)",
     )
-    argument_parser.add_argument("dummy", nargs=argparse.REMAINDER)
-    return argument_parser.parse_args()
+    argument_parser.add_argument(
+        "--no-cache",
+        action="store_false",
+        dest="use_cache",
+        help="Do not use the cache for MusicBrainz lookups",
+    )
+    argument_parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="Clear the cache for MusicBrainz lookups before starting",
+    )
+    # Ignore any unexpected arguments
+    # (e.g. the selected files passed by Nautilus)
+    arguments, _ = argument_parser.parse_known_args()
+    return arguments
 
 
 def main(arguments=None):
     """Main script function"""
     selected_directory = None
+    use_cache = True
+    clear_cache = False
     try:
         loglevel = arguments.loglevel
         selected_directory = arguments.directory
+        use_cache = arguments.use_cache
+        clear_cache = arguments.clear_cache
     except AttributeError:
         loglevel = logging.WARNING
     #
@@ -1359,22 +1670,12 @@ def main(arguments=None):
         format="%(levelname)-8s\u2551 %(funcName)s → %(message)s",
         level=loglevel,
     )
-    try:
-        selected_names = os.environ["NAUTILUS_SCRIPT_SELECTED_FILE_PATHS"]
-    except KeyError:
-        pass
-    else:
-        for name in selected_names.splitlines():
-            if name:
-                current_path = pathlib.Path(name)
-                if current_path.is_dir():
-                    selected_directory = current_path
-                    break
-                #
-            #
-        #
-    #
-    UserInterface(selected_directory)
+    selected_directory = gui_commons.get_selected_directory(
+        default=selected_directory
+    )
+    UserInterface(
+        selected_directory, use_cache=use_cache, clear_cache=clear_cache
+    )
 
 
 if __name__ == "__main__":
@@ -1382,12 +1683,10 @@ if __name__ == "__main__":
     # Workaround for unexpected behavior when called
     # as a Nautilus script in combination with argparse
     # =========================================================================
-    sys.exit(main(__get_arguments()))
-    # try:
-    #     sys.exit(main(__get_arguments()))
-    # except Exception:
-    #     sys.exit(main())
+    if os.environ.get("NAUTILUS_SCRIPT_SELECTED_FILE_PATHS") is not None:
+        sys.exit(main())
     #
+    sys.exit(main(__get_arguments()))
 
 
 # vim: fileencoding=utf-8 ts=4 sts=4 sw=4 autoindent expandtab syntax=python: